@@ -1,3 +1,7 @@
+_MISSING = object()
+_NUMERIC_PREFIX = frozenset("+-.0123456789")
+
+
 class Params:
     """
     파라미터(설정값) 딕셔너리를 다양한 타입으로 안전하게 접근/변환할 수 있도록 지원하는 헬퍼 클래스입니다.
@@ -6,16 +10,23 @@ class Params:
     - 문자열 값을 int, float, bool, list 등으로 자동 변환
     - 미존재 키나 None 입력에 대한 안전 처리
     - dict-like 및 attribute-style 접근 동시 지원
+    - 한 번 변환한 값은 캐싱하여 재접근 시 다시 변환하지 않음
     """
 
+    __slots__ = ("_configure", "_cache")
+
     def __init__(self, configure):
         """
         파라미터 딕셔너리를 받아 내부에 저장합니다.
 
+        키는 저장 시점에 소문자로 정규화하여 조회마다 다시 변환하지 않습니다.
+        (문자열이 아닌 키는 str()로 변환 후 정규화, 원본 딕셔너리는 복사되어 이후 변경이 반영되지 않음)
+
         Args:
             configure (dict): 파라미터(설정값) 딕셔너리
         """
-        self._configure = configure
+        self._configure = {str(k).lower(): v for k, v in (configure or {}).items()}
+        self._cache = {}
 
     def cast_data_type(self, v: str):
         """
@@ -23,47 +34,52 @@ class Params:
         변환 불가 시 원본 값을 반환합니다.
 
         Args:
-            v (str): 변환 대상 값
+            v (str): 변환 대상 값 (문자열이 아니면 그대로 반환)
         Returns:
             변환된 값 (int, float, bool, list, str)
         """
-        if isinstance(v, int):
+        if not isinstance(v, str):
             return v
-        try:
-            return int(v)
-        except ValueError:
-            pass
 
-        try:
-            return float(v)
-        except ValueError:
-            pass
+        if "," in v:
+            return [self.cast_data_type(_v) for _v in v.split(",")]
 
-        if v.upper() == "TRUE":
+        # 숫자로 시작하는 값만 변환을 시도하여 일반 문자열에서 예외가 발생하지 않도록 함
+        if v.lstrip()[:1] in _NUMERIC_PREFIX:
+            try:
+                if "." in v or "e" in v or "E" in v:
+                    return float(v)
+                return int(v)
+            except ValueError:
+                pass
+
+        upper = v.upper()
+        if upper == "TRUE":
             return True
 
-        if v.upper() == "FALSE":
+        if upper == "FALSE":
             return False
 
-        if "," in v:
-            return [self.cast_data_type(_v) for _v in v.split(",")]
-
         return v
 
     def __getattr__(self, item):
         """
         attribute-style 접근 시 호출되며, 해당 키가 있으면 변환 후 반환합니다.
         미존재 시 None 반환.
+        밑줄(_)로 시작하는 이름은 설정 키가 아닌 속성 조회로 보고 AttributeError를 발생시킵니다.
 
         Args:
             item (str): 접근할 키
         Returns:
             변환된 값 또는 None
+        Raises:
+            AttributeError: 밑줄(_)로 시작하는 이름인 경우
         """
-        if not self.include(item):
-            return None
+        # copy/pickle, IPython 등의 내부 속성 탐색이 설정 조회로 이어지지 않도록 차단
+        if item.startswith("_"):
+            raise AttributeError(item)
 
-        return self.cast_data_type(self._configure[item.lower()])
+        return self._get_cast(item.lower())
 
     def __getitem__(self, item):
         """
@@ -75,10 +91,30 @@ class Params:
         Returns:
             변환된 값 또는 None
         """
-        if not self.include(item):
-            return None
+        return self._get_cast(item.lower())
 
-        return self.cast_data_type(self._configure[item.lower()])
+    def _get_cast(self, key, default=None):
+        """
+        캐시된 변환 값을 반환하며, 캐시에 없으면 변환 후 저장합니다.
+        존재 여부 확인과 조회를 한 번의 딕셔너리 조회로 처리합니다.
+        리스트 값은 캐시를 보호하기 위해 매번 복사본을 반환합니다.
+
+        Args:
+            key (str): 소문자로 정규화된 키
+            default: 키가 없을 때 반환할 값
+        Returns:
+            변환된 값 또는 기본값
+        """
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            raw = self._configure.get(key, _MISSING)
+            if raw is _MISSING:
+                return default
+            value = self._cache[key] = self.cast_data_type(raw)
+        if type(value) is list:
+            # 캐시된 리스트를 호출자가 수정해도 다른 호출자에게 영향이 없도록 복사본 반환
+            return list(value)
+        return value
 
     def __contains__(self, item):
         """
@@ -100,9 +136,6 @@ class Params:
         Returns:
             bool: 존재 여부
         """
-        if self._configure is None:
-            return False
-
         return key.lower() in self._configure
 
     def get_default(self, key, default):
@@ -115,6 +148,4 @@ class Params:
         Returns:
             변환된 값 또는 기본값
         """
-        if self.include(key):
-            return self[key]
-        return default
+        return self._get_cast(key.lower(), default)
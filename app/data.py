@@ -1,46 +1,102 @@
-import re
 import dataclasses
-from typing import List, Union
-from src.utils import Numeric
+from typing import Any, Iterable, List, Tuple
 
 
-@dataclasses.dataclass(frozen=True)
+def _to_bytes(value: Any) -> bytes:
+    # bytes는 그대로 사용하고, str은 UTF-8로 인코딩, 그 외 값(int 등)은 str()로 변환 후 인코딩
+    if type(value) is bytes:
+        return value
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    if not isinstance(value, str):
+        value = str(value)
+    return value.encode('utf-8')
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class ReceivedData:
-    cmd: str
-    data: List[str]
+    cmd: bytes
+    data: Tuple[bytes, ...]
+
+    def __post_init__(self):
+        # str/List[str]로 생성하던 기존 호출도 받을 수 있도록 생성 시점에 bytes로 정규화
+        object.__setattr__(self, 'cmd', _to_bytes(self.cmd))
+        object.__setattr__(self, 'data', tuple(_to_bytes(datum) for datum in self.data))
+
+    @property
+    def cmd_str(self) -> str:
+        """cmd를 UTF-8 문자열로 디코딩 (사용할 때만 디코딩)"""
+        return self.cmd.decode('utf-8')
+
+    @property
+    def data_str(self) -> Tuple[str, ...]:
+        """data 각 항목을 UTF-8 문자열로 디코딩 (사용할 때만 디코딩)"""
+        return tuple(datum.decode('utf-8') for datum in self.data)
 
     @classmethod
     def from_bytes(cls, data: bytes):
-        data = data.decode('utf-8')
-        split_data = data.split('#')
+        head, sep, rest = bytes(data).partition(b'#')
 
-        if len(split_data) == 1:
-            return cls(cmd=split_data[0], data=[])
+        if not sep:
+            return cls(cmd=head, data=())
 
-        return cls(cmd=split_data[0], data=split_data[1:])
+        return cls(cmd=head, data=tuple(rest.split(b'#')))
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class SendData:
-    cmd: str
-    data: List[str] = dataclasses.field(default_factory=list)
+    cmd: bytes
+    data: Tuple[bytes, ...] = ()
+
+    def __post_init__(self):
+        # 잘못된 타입은 Requester 스레드가 아닌 생성 시점에 드러나도록 여기서 변환/검증
+        object.__setattr__(self, 'cmd', _to_bytes(self.cmd))
+        object.__setattr__(self, 'data', tuple(_to_bytes(datum) for datum in self.data))
+
+    @property
+    def cmd_str(self) -> str:
+        """cmd를 UTF-8 문자열로 디코딩 (사용할 때만 디코딩)"""
+        return self.cmd.decode('utf-8')
+
+    @property
+    def data_str(self) -> Tuple[str, ...]:
+        """data 각 항목을 UTF-8 문자열로 디코딩 (사용할 때만 디코딩)"""
+        return tuple(datum.decode('utf-8') for datum in self.data)
 
     def to_bytes(self) -> bytes:
-        result = self.cmd
-        for datum in self.data:
-            result += f"#{datum}"
+        return b'#'.join((self.cmd, *self.data))
 
-        return result.encode('utf-8')
+    def to_parts(self) -> List[bytes]:
+        parts = [self.cmd]
+        for datum in self.data:
+            parts.append(b'#')
+            parts.append(datum)
+        return parts
 
 
 class PacketStructure:
     HEAD_PACKET = b'$'
     TAIL_PACKET = b'$'
+    _SEP = TAIL_PACKET + HEAD_PACKET
 
     @classmethod
     def to_packet(cls, data: bytes) -> bytes:
         return cls.HEAD_PACKET + data + cls.TAIL_PACKET
 
+    @classmethod
+    def to_packet_from_parts(cls, parts: Iterable[bytes]) -> bytes:
+        return b''.join([cls.HEAD_PACKET, *parts, cls.TAIL_PACKET])
+
+    @classmethod
+    def to_packets_from_parts(cls, frames: Iterable[Iterable[bytes]]) -> bytes:
+        # 여러 프레임을 한 번의 join으로 이어 붙여 한 번에 전송 (split_packet으로 다시 분리 가능)
+        chunks = []
+        for parts in frames:
+            chunks.append(cls.HEAD_PACKET)
+            chunks.extend(parts)
+            chunks.append(cls.TAIL_PACKET)
+        return b''.join(chunks)
+
     @classmethod
     def from_packet(cls, packet: bytes) -> bytes:
         if not cls.is_valid(packet):
@@ -48,27 +104,30 @@ class PacketStructure:
 
         return packet[1:-1]
 
+    @classmethod
+    def from_packet_trusted(cls, packet: bytes) -> bytes:
+        # split_packet 결과처럼 구조가 이미 보장된 프레임 전용 (검증 생략)
+        return packet[1:-1]
+
     @classmethod
     def is_valid(cls, packet: bytes) -> bool:
-        if (cls.TAIL_PACKET + cls.HEAD_PACKET) in packet:
+        if cls._SEP in packet:
             return False
 
-        if packet[:1] != cls.HEAD_PACKET:
+        if not packet.startswith(cls.HEAD_PACKET):
             return False
 
-        if packet[-1:] != cls.TAIL_PACKET:
+        if not packet.endswith(cls.TAIL_PACKET):
             return False
 
         return True
 
     @classmethod
-    def split_packet(cls, packet: bytes) -> list[bytes]:
-        results = []
-        for _d in packet.split(cls.HEAD_PACKET):
-            if len(_d) == 0:
-                continue
-            results.append(cls.HEAD_PACKET+_d+cls.TAIL_PACKET)
-        return results
+    def split_packet(cls, packet: bytes) -> List[bytes]:
+        head = cls.HEAD_PACKET
+        tail = cls.TAIL_PACKET
+        # 머리 바이트로 나눈 조각마다 머리/꼬리를 다시 붙임 (빈 조각은 건너뜀)
+        return [head + chunk + tail for chunk in bytes(packet).split(head) if chunk]
 
 
 if __name__ == "__main__":
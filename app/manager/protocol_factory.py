@@ -2,6 +2,9 @@ from typing import List
 from app.common.params import Params
 from app.interfaces.protocol import ReqResProtocol, PubSubProtocol
 
+# 첫 호출 시 임포트한 MQTT 구현 모듈 (지연 임포트 결과 재사용)
+_mqtt_module = None
+
 
 def valid_params(params: Params, need_params: List[str]):
     """
@@ -38,11 +41,13 @@ def create_mqtt_protocol(
     Returns:
         PubSubProtocol: MQTT 프로토콜 객체
     """
-    from app.protocols.mqtt.mqtt_protocol import MQTTProtocol, BrokerConfig, ClientConfig
+    global _mqtt_module
+    if _mqtt_module is None:
+        from app.protocols.mqtt import mqtt_protocol as _mqtt_module
 
-    broker_config = BrokerConfig(broker_address=broker_address, port=port, keepalive=keepalive)
-    client_config = ClientConfig()
-    return MQTTProtocol(broker_config, client_config)
+    broker_config = _mqtt_module.BrokerConfig(broker_address=broker_address, port=port, keepalive=keepalive)
+    client_config = _mqtt_module.ClientConfig()
+    return _mqtt_module.MQTTProtocol(broker_config, client_config)
 
 
 def create_protocol(params: Params) -> PubSubProtocol:
@@ -21,9 +21,10 @@ class ReqResManager:
         """
         등록된 프로토콜 인스턴스를 반환합니다.
         """
-        if name.lower() not in cls._plugins:
+        plugin = cls._plugins.get(name.lower())
+        if plugin is None:
             raise ValueError(f"'{name}' 프로토콜이 등록되지 않았습니다.")
-        return cls._plugins[name.lower()]
+        return plugin
 
     @classmethod
     def connect(cls, name: str) -> bool:
@@ -73,9 +74,10 @@ class PubSubManager:
         """
         등록된 프로토콜 인스턴스를 가져옵니다.
         """
-        if name.lower() not in cls._plugins:
+        plugin = cls._plugins.get(name.lower())
+        if plugin is None:
             raise ValueError(f"'{name}' 프로토콜이 등록되지 않았습니다.")
-        return cls._plugins[name.lower()]
+        return plugin
 
     @classmethod
     def connect(cls, name: str) -> bool:
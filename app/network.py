@@ -1,14 +1,22 @@
-import time
-import queue
+import logging
 import threading
+import collections
 from typing import Union, Any, Dict
-from lib.communication.data import SendData, ReceivedData
+from lib.communication.data import SendData, ReceivedData, PacketStructure
 from lib.communication.worker import ListenerEvent, RequesterEvent, Listener, Requester
 from lib.communication.protocol.interface import Protocol
 from lib.communication.protocol.factory import create_protocol
 
 from src.configure import Params  # TODO : src 의존성 제거하기
-from src.logger import AppLogger
+
+logger = logging.getLogger(__name__)
+
+
+class _NetIdAdapter(logging.LoggerAdapter):
+    """메시지 앞에 net_id를 붙이는 어댑터 (로그 레벨이 활성화된 경우에만 포맷)"""
+
+    def process(self, msg, kwargs):
+        return f"[{self.extra['net_id']}] {msg}", kwargs
 
 
 class NetworkEvent:
@@ -16,63 +24,78 @@ class NetworkEvent:
 
 
 class NetworkHandler(threading.Thread, ListenerEvent, RequesterEvent):
-    def __init__(self, network_config: Dict, event_callback: NetworkEvent, net_id: Any = None):
+    def __init__(self, network_config: Dict, event_callback: NetworkEvent, net_id: Any = None,
+                 retry_interval: float = 0.1, batch_size: int = 32, max_queue_size: int = 4096):
         super().__init__()
         self._net_id = net_id
+        self._logger = _NetIdAdapter(logger, {"net_id": net_id})
         self._stop_flag = threading.Event()
         self._network_config = network_config
         self._protocol = None
         self._requester = None
         self._listener = None
         self._request_queue = None
+        self._queue_event = threading.Event()
+        # 여러 생산자가 동시에 send_data를 호출해도 큐 크기 확인과 추가가 함께 이뤄지도록 보호
+        self._queue_lock = threading.Lock()
         self._retry_flag = True
+        self._retry_event = threading.Event()
+        self._retry_event.set()
+        self._retry_interval = retry_interval
+        self._batch_size = batch_size
+        self._max_queue_size = max_queue_size
 
         self._event_callback = event_callback
 
     def on_sent(self, data: SendData):
-        AppLogger.write_debug(self, f"on_sent - {self._net_id} - {data}", print_to_terminal=True)
+        self._logger.debug("on_sent - %r", data)
 
     def on_failed_send(self, data: SendData):
-        AppLogger.write_error(self, f"on_failed_send - {self._net_id} - {data}", print_to_terminal=True)
+        self._logger.error("on_failed_send - %r", data)
 
     def on_received(self, data: ReceivedData):
-        AppLogger.write_debug(self, f"on_received - {self._net_id} - {data}", print_to_terminal=True)
+        self._logger.debug("on_received - %r", data)
 
     def on_failed_recv(self, data: ReceivedData):
-        AppLogger.write_error(self, f"on_failed_recv - {self._net_id} - {data}", print_to_terminal=True)
+        self._logger.error("on_failed_recv - %r", data)
 
     def on_disconnected(self, data: Union[ReceivedData, SendData]):
-        AppLogger.write_debug(self, f"on_disconnected - {self._net_id}", print_to_terminal=True)
+        self._logger.debug("on_disconnected")
         self._retry_flag = True
+        self._retry_event.set()
 
     def start_communication(self):
-        AppLogger.write_debug(self, f"start_communication - {self._net_id} - wait for connection...", print_to_terminal=True)
+        self._logger.debug("start_communication - wait for connection...")
         self._protocol = create_protocol(
             params=self._network_config
         )
-        while not self._stop_flag.is_set():
-            time.sleep(0.001)
-            if self._protocol.connect():
-                AppLogger.write_debug(self, f"  {self._net_id} - connected !!", print_to_terminal=True)
-                break
+        while not self._protocol.connect():
+            if self._stop_flag.wait(timeout=self._retry_interval):
+                return
+        self._logger.debug("connected !!")
 
-        self._request_queue = queue.Queue()
+        self._request_queue = collections.deque()
 
         self._listener = Listener(
             event_callback=self,
+            packet_structure_impl=PacketStructure,
             protocol=self._protocol
         )
 
         self._requester = Requester(
             event_callback=self,
             protocol=self._protocol,
-            request_queue=self._request_queue
+            request_queue=self._request_queue,
+            queue_event=self._queue_event,
+            batch_size=self._batch_size
         )
 
         self._listener.start()
         self._requester.start()
 
+        # 이전 Listener가 종료되기 전까지 반복 호출한 on_disconnected 신호는 여기서 버림
         self._retry_flag = False
+        self._retry_event.clear()
 
     def stop_communications(self):
         if isinstance(self._listener, Listener) and self._listener.is_alive():
@@ -94,25 +117,35 @@ class NetworkHandler(threading.Thread, ListenerEvent, RequesterEvent):
         if not isinstance(data, SendData):
             raise ValueError(f"Invalid data type. {data}")
 
-        if not self._request_queue:
-            AppLogger.write_debug(self,
-                                  f"Request Queue is not initialized. {self._net_id}, May be not connected yet",
-                                  print_to_terminal=True)
-            return False
-
-        self._request_queue.put(data)
+        # 큐가 가득 차면 가장 오래된 요청을 버리지 않고 새 요청을 거부 (소비 측 popleft는 락 불필요)
+        # 재연결로 큐가 교체되어도 크기 확인과 추가가 같은 큐에 대해 이뤄지도록 락 안에서 한 번만 읽음
+        with self._queue_lock:
+            queue = self._request_queue
+            if queue is None:
+                self._logger.debug("Request Queue is not initialized. May be not connected yet")
+                return False
+            if len(queue) >= self._max_queue_size:
+                self._logger.warning("Request Queue is full - %r", data)
+                return False
+            queue.append(data)
+
+        queue_event = self._queue_event
+        if not queue_event.is_set():
+            queue_event.set()
 
         return True
 
     def stop(self):
         self._stop_flag.set()
+        self._retry_event.set()
 
     def run(self):
         self._stop_flag.clear()
         while not self._stop_flag.is_set():
-            time.sleep(0.0001)
-            if self._retry_flag:
-                self.reconnect()
+            self._retry_event.wait()
+            if self._stop_flag.is_set():
+                break
+            self.reconnect()
         self.stop_communications()
 
     def is_connected(self) -> bool:
@@ -3,18 +3,22 @@ from uuid import uuid4
 from dataclasses import dataclass, field
 
 import threading
-from typing import Optional, Callable, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, Any, Iterable
 from dataclasses import dataclass
 import logging
 import time
-import queue as Queue
 from app.interfaces.protocol import PubSubProtocol
+from app.protocols.mqtt.topic_trie import TopicTrie, is_wildcard_filter
 from app.common.exception import (
     ProtocolConnectionError,
     ProtocolValidationError,
     ProtocolError,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class BrokerConfig:
@@ -27,6 +31,12 @@ class BrokerConfig:
         mode (str): "blocking" 또는 "non-blocking" 모드 (기본값: "non-blocking")
         username (Optional[str]): 사용자 이름 (선택 사항)
         password (Optional[str]): 비밀번호 (선택 사항)
+        connect_timeout (float): connect/disconnect/재연결 시 브로커 응답 대기 시간(초) (기본값: 5.0)
+        queue_max (int): 연결 해제 중 보관할 최대 발행 메시지 수, 초과 시 가장 오래된 메시지부터 버림 (기본값: 10000)
+        dispatch_workers (int): 구독 콜백 실행 스레드 수 (기본값: 1)
+            - 1: 별도 스레드 하나에서 수신 순서대로 실행 (기존 구독자의 순서 보장 유지)
+            - 2 이상: 여러 스레드에서 동시에 실행 - 같은 토픽의 연속 메시지도 순서가 보장되지 않음
+            - 0: 스레드 풀 없이 네트워크 스레드에서 수신 순서대로 직접 실행
     """
     broker_address: str
     port: int = 1883
@@ -35,6 +45,9 @@ class BrokerConfig:
     mode: str = "non-blocking"
     username: Optional[str] = None
     password: Optional[str] = None
+    connect_timeout: float = 5.0
+    queue_max: int = 10_000
+    dispatch_workers: int = 1
 
 
 @dataclass
@@ -66,11 +79,21 @@ class MQTTProtocol(PubSubProtocol):
                 userdata=self.handler
             )
         except Exception as e:
-            logging.error(f"MQTT 클라이언트 생성 실패: {e}")
+            logger.error("MQTT 클라이언트 생성 실패: %s", e)
             raise ProtocolError(f"MQTT 클라이언트 생성 실패: {e}")
 
-        # 구독 정보 저장용 딕셔너리 - 토픽별 콜백 리스트
-        self._subscriptions: dict[str, list[Callable]] = {}
+        # 구독 정보 - 토픽별 콜백 튜플 (copy-on-write: 변경 시 새 딕셔너리로 통째로 교체하므로 읽을 때 락이 필요 없음)
+        self._subscriptions: dict[str, tuple[Callable, ...]] = {}
+        # 와일드카드('+', '#') 토픽 필터 전용 트라이 - 일반 토픽은 _subscriptions에서 한 번에 조회
+        self._wildcards = TopicTrie()
+        # 구독 정보 변경(subscribe/unsubscribe) 시 쓰기 측끼리만 직렬화하는 락
+        self._subs_lock = threading.Lock()
+
+        # 구독 콜백 실행용 스레드 풀 - paho 네트워크 스레드가 사용자 콜백에 막히지 않도록 분리
+        self._cb_pool: Optional[ThreadPoolExecutor] = None
+        # __init__/connect()/disconnect()에서 풀 생성과 종료가 겹치지 않도록 보호
+        self._cb_pool_lock = threading.Lock()
+        self._start_callback_pool()
 
         # 인증 설정
         if broker_config.username and broker_config.password:
@@ -80,19 +103,26 @@ class MQTTProtocol(PubSubProtocol):
                     password=broker_config.password
                 )
             except Exception as e:
-                logging.error(f"MQTT 인증 설정 실패: {e}")
+                logger.error("MQTT 인증 설정 실패: %s", e)
                 raise ProtocolError(f"MQTT 인증 설정 실패: {e}")
 
         # 콜백 설정
         self.client.on_connect = self._on_connect
         self.client.on_disconnect = self._on_disconnect
         self.client.on_message = self._on_message
+        # 발행 경로에서 매번 속성 조회를 하지 않도록 바인딩된 메서드를 보관
+        self._client_publish = self.client.publish
 
-        # 연결 상태 플래그
-        self._is_connected = False
+        # 연결 상태 이벤트 - paho 콜백에서 set/clear 되며 대기 중인 스레드를 즉시 깨움
+        self._connected_event = threading.Event()
+        self._disconnected_event = threading.Event()
+        self._disconnected_event.set()
 
-        self._publish_queue = Queue.Queue()
+        # 연결 해제 중 발행 요청 보관 큐 - 길이 제한으로 장시간 단절 시 메모리 증가를 막음
+        self._publish_queue: deque[tuple] = deque(maxlen=broker_config.queue_max)
         self._publish_lock = threading.Lock()
+        # 큐가 가득 차 버려진 메시지 수
+        self._dropped = 0
 
         # 자동 재연결 관련
         self._auto_reconnect = True
@@ -105,6 +135,20 @@ class MQTTProtocol(PubSubProtocol):
         """연결 상태 확인"""
         return self._is_connected
 
+    @property
+    def _is_connected(self) -> bool:
+        """연결 상태 플래그 (_connected_event 기반)"""
+        return self._connected_event.is_set()
+
+    @_is_connected.setter
+    def _is_connected(self, value: bool):
+        if value:
+            self._disconnected_event.clear()
+            self._connected_event.set()
+        else:
+            self._connected_event.clear()
+            self._disconnected_event.set()
+
     class MQTTHandler:
         """
         MQTT 핸들러 클래스
@@ -125,12 +169,12 @@ class MQTTProtocol(PubSubProtocol):
                 None
             """
             self.parent._is_connected = True
-            logging.info(f"[{self.name}] - [{self.client_id}] MQTT 연결 성공")
+            logger.info("[%s] - [%s] MQTT 연결 성공", self.name, self.client_id)
 
             if flags.get("session present", False):
-                logging.info(f"[{self.client_id}] 기존 세션 복원되었습니다.")
+                logger.info("[%s] 기존 세션 복원되었습니다.", self.client_id)
             else:
-                logging.info(f"[{self.client_id}] 새로운 세션으로 연결되었습니다.")
+                logger.info("[%s] 새로운 세션으로 연결되었습니다.", self.client_id)
 
         def handle_connect_failure(self, rc: int):
             """
@@ -142,7 +186,7 @@ class MQTTProtocol(PubSubProtocol):
                 None
             """
             self.parent._is_connected = False
-            logging.error(f"[{self.name}] - [{self.client_id}] MQTT 연결 실패 (rc={rc})")
+            logger.error("[%s] - [%s] MQTT 연결 실패 (rc=%s)", self.name, self.client_id, rc)
 
         def handle_disconnect(self, rc: int):
             """
@@ -162,9 +206,9 @@ class MQTTProtocol(PubSubProtocol):
             """
             self.parent._is_connected = False
             if rc == 0:
-                logging.info(f"[{self.client_id}] 정상적으로 연결이 종료되었습니다.")
+                logger.info("[%s] 정상적으로 연결이 종료되었습니다.", self.client_id)
             else:
-                logging.warning(f"[{self.client_id}] 예기치 않은 연결 종료 (rc={rc})")
+                logger.warning("[%s] 예기치 않은 연결 종료 (rc=%s)", self.client_id, rc)
 
         def handle_message(self, topic: str, payload: bytes):
             """
@@ -176,14 +220,45 @@ class MQTTProtocol(PubSubProtocol):
             Returns:
                 None
             """
-            if topic in self.parent._subscriptions:
-                callbacks = self.parent._subscriptions[topic]
+            # 수신 토픽에는 와일드카드가 없으므로 와일드카드 필터 키와 겹치지 않음
+            callbacks = self.parent._subscriptions.get(topic, ())
+            wildcards = self.parent._wildcards
+            if wildcards:
+                callbacks += wildcards.match(topic)
+            if not callbacks:
+                return
+
+            pool = self.parent._cb_pool
+            if pool is None:
+                # dispatch_workers=0이거나 disconnect()로 풀이 없는 경우 - 현재 스레드에서 순서대로 직접 실행
                 for callback in callbacks:
-                    if callable(callback):
-                        try:
-                            callback(topic, payload)
-                        except Exception as e:
-                            logging.error(f"[{self.name}] - [{self.client_id}] {topic} 콜백 실행 중 오류 발생: {e}")
+                    self._safe_call(callback, topic, payload)
+                return
+
+            # 콜백 튜플은 불변 스냅샷이며, 호출 가능 여부는 subscribe 시점에 검증됨
+            for callback in callbacks:
+                try:
+                    pool.submit(self._safe_call, callback, topic, payload)
+                except RuntimeError:
+                    # disconnect()로 풀이 종료된 직후 도착한 메시지 - 남은 콜백까지 현재 스레드에서 실행
+                    logger.warning("[%s] 콜백 풀이 종료되어 현재 스레드에서 콜백을 실행합니다 - %s", self.client_id, topic)
+                    self._safe_call(callback, topic, payload)
+
+        def _safe_call(self, callback: Callable[[str, bytes], None], topic: str, payload: bytes):
+            """
+            콜백 스레드 풀에서 사용자 콜백을 실행하고, 예외는 로그로 남깁니다.
+
+            Args:
+                callback (Callable): 실행할 콜백
+                topic (str): 수신한 메시지의 토픽
+                payload (bytes): 수신한 메시지의 페이로드
+            Returns:
+                None
+            """
+            try:
+                callback(topic, payload)
+            except Exception as e:
+                logger.error("[%s] - [%s] %s 콜백 실행 중 오류 발생: %s", self.name, self.client_id, topic, e)
 
         def handler_flush_publish_queue(self, publish_func):
             """
@@ -195,15 +270,20 @@ class MQTTProtocol(PubSubProtocol):
             Returns:
                 None
             """
-            logging.info("큐에 남아 있는 메시지를 발행합니다.")
-            while not self.parent._publish_queue.empty():
+            logger.info("큐에 남아 있는 메시지를 발행합니다.")
+            popleft = self.parent._publish_queue.popleft
+            while True:
+                # deque.popleft는 원자적이므로 동시에 추가되는 메시지도 유실 없이 꺼냄
+                try:
+                    topic, message, qos, retain = popleft()
+                except IndexError:
+                    break
                 try:
-                    topic, message, qos, retain = self.parent._publish_queue.get_nowait()
                     result = publish_func(topic, message, qos, retain)
                     if result.rc != 0:
-                        logging.error(f"[{self.name}] - [{self.client_id}] 재발행 실패 - {topic}")
+                        logger.error("[%s] - [%s] 재발행 실패 - %s", self.name, self.client_id, topic)
                 except Exception as e:
-                    logging.error(f"[{self.name}] - [{self.client_id}] 큐 발행 중 예외 발생: {e}")
+                    logger.error("[%s] - [%s] 큐 발행 중 예외 발생: %s", self.name, self.client_id, e)
 
 
     def _on_connect(self, client, userdata, flags, rc):
@@ -228,18 +308,19 @@ class MQTTProtocol(PubSubProtocol):
             userdata.handle_connect(flags=flags)
 
             # 연결 성공 시, 기존 구독 복구
-            for topic in self._subscriptions.keys():
+            # 불변 스냅샷을 순회하므로 락 불필요
+            for topic in self._subscriptions:
                 try:
                     result, _ = client.subscribe(topic=topic, qos=0)
                     if result != MQTT_ERR_SUCCESS:
-                        logging.error(f"[{client_id}] 구독 복구 실패 - {topic}: {result}")
+                        logger.error("[%s] 구독 복구 실패 - %s: %s", client_id, topic, result)
                 except Exception as e:
-                    logging.error(f"[{client_id}] 구독 복구 중 오류 발생 - {topic}: {e}")
-            logging.info("구독 복구 완료")
+                    logger.error("[%s] 구독 복구 중 오류 발생 - %s: %s", client_id, topic, e)
+            logger.info("구독 복구 완료")
 
             # 데이터 유실 방지 - 재연결 후 큐에 남아 있던 메시지를 다시 발행
-            if not self._publish_queue.empty():
-                logging.info("재연결 후 큐에 남아 있던 메시지를 발행합니다.")
+            if self._publish_queue:
+                logger.info("재연결 후 큐에 남아 있던 메시지를 발행합니다.")
             userdata.handler_flush_publish_queue(client.publish)
 
         else:
@@ -295,6 +376,7 @@ class MQTTProtocol(PubSubProtocol):
         Raises:
             ProtocolConnectionError: 연결 실패 시 예외 발생
         """
+        self._start_callback_pool()
         try:
             self.client.connect(
                 host=self.broker_config.broker_address,
@@ -308,11 +390,9 @@ class MQTTProtocol(PubSubProtocol):
             else:
                 self.client.loop_start()
 
-            for _ in range(10):
-                logging.debug(f"브로커 연결 중... {self._is_connected}")
-                if self._is_connected:
-                    return True
-                time.sleep(0.5)
+            logger.debug("브로커 연결 중...")
+            if self._connected_event.wait(timeout=self.broker_config.connect_timeout):
+                return True
             raise ProtocolConnectionError("연결 시간 초과")
 
         except Exception as e:
@@ -339,11 +419,14 @@ class MQTTProtocol(PubSubProtocol):
             self.client.loop_stop()
         self.client.disconnect()
 
-        # 연결 해제 대기 루프 (최대 5초)
-        for _ in range(10):
-            if not self._is_connected:
-                break
-            time.sleep(0.5)
+        # 이미 수신해 대기 중인 콜백은 취소하지 않고 모두 실행 (콜백 안에서 호출돼도 막히지 않도록 wait=False)
+        with self._cb_pool_lock:
+            pool, self._cb_pool = self._cb_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+        # 연결 해제 대기 (on_disconnect 수신 시 즉시 반환)
+        self._disconnected_event.wait(timeout=self.broker_config.connect_timeout)
 
     def publish(self, topic: str, message: str, qos: int = 0, retain: bool = False) -> bool:
         """
@@ -360,47 +443,128 @@ class MQTTProtocol(PubSubProtocol):
             ProtocolValidationError: 발행 실패 시 예외 발생
         """
         try:
-            if not self._is_connected:
-                logging.warning(f"디스커넥트 상태에서 메시지 큐에 추가: {topic}")
-                self._publish_queue.put((topic, message, qos, retain))
-                return False
+            if self._connected_event.is_set():
+                return self._client_publish(topic, message, qos, retain).rc == MQTT_ERR_SUCCESS
 
-            result = self.client.publish(topic, message, qos, retain)
-            return result.rc == MQTT_ERR_SUCCESS
+            logger.warning("디스커넥트 상태에서 메시지 큐에 추가: %s", topic)
+            with self._publish_lock:
+                self._queue_offline((topic, message, qos, retain))
+            return False
         except Exception as e:
-            logging.error(f"Publish error: {e}")
+            logger.error("Publish error: %s", e)
             return False
 
+    def publish_all(self, messages: Iterable[tuple[str, Any, int, bool]]) -> list[bool]:
+        """
+        여러 메시지를 순서대로 발행
+        연결 상태 확인과 락 획득을 한 번만 수행하여 다른 publish_all 호출과 메시지가 섞이지 않습니다.
+        소켓 쓰기는 합치지 않으며, 메시지마다 paho가 개별 패킷으로 송신합니다.
+
+        Args:
+            messages (Iterable[tuple]): (topic, message, qos, retain) 튜플 목록
+        Returns:
+            list[bool]: 메시지별 발행 성공 여부 (연결 해제 상태에서는 모두 큐에 추가되고 False)
+        """
+        messages = list(messages)
+        with self._publish_lock:
+            if not self._connected_event.is_set():
+                logger.warning("디스커넥트 상태에서 메시지 %d건 큐에 추가", len(messages))
+                for item in messages:
+                    self._queue_offline(item)
+                return [False] * len(messages)
+
+            publish = self._client_publish
+            results = []
+            for topic, message, qos, retain in messages:
+                try:
+                    results.append(publish(topic, message, qos, retain).rc == MQTT_ERR_SUCCESS)
+                except Exception as e:
+                    logger.error("Publish error: %s", e)
+                    results.append(False)
+            return results
+
+    def _queue_offline(self, item: tuple):
+        """
+        연결 해제 중 발행 요청을 큐에 보관합니다. _publish_lock을 잡은 상태에서 호출해야 합니다.
+        큐가 가득 차 있으면 가장 오래된 메시지가 버려지고 _dropped가 증가합니다.
+
+        Args:
+            item (tuple): (topic, message, qos, retain)
+        Returns:
+            None
+        """
+        queue = self._publish_queue
+        if len(queue) == queue.maxlen:
+            self._dropped += 1
+            logger.warning("발행 큐가 가득 차 가장 오래된 메시지를 버립니다 (누적 %d건)", self._dropped)
+        queue.append(item)
 
     def subscribe(self, topic: str, callback: Callable[[str, bytes], None], qos: int = 0) -> bool:
         """토픽 구독"""
+        if not callable(callback):
+            raise ProtocolValidationError(f"[{self.client_config.client_id}] 호출 불가능한 콜백: {callback!r}")
+
         try:
             # 토픽이 처음 구독되는 경우만 브로커에 구독 요청
-            is_new_topic = topic not in self._subscriptions
-
-            # 콜백 추가
-            if topic not in self._subscriptions:
-                self._subscriptions[topic] = []
-            self._subscriptions[topic].append(callback)
+            with self._subs_lock:
+                callbacks = self._subscriptions.get(topic, ())
+                is_new_topic = not callbacks
+                # 같은 콜백을 여러 번 구독하면 구독한 횟수만큼 호출됨
+                self._set_callbacks(topic, callbacks + (callback,))
 
             if is_new_topic:
                 result, _ = self.client.subscribe(topic=topic, qos=qos)
                 if result != MQTT_ERR_SUCCESS:
-                    # 실패 시 콜백 제거
-                    self._subscriptions[topic].remove(callback)
-                    if not self._subscriptions[topic]:
-                        del self._subscriptions[topic]
                     raise ProtocolValidationError(f"[{self.client_config.client_id}] 구독 실패: {result}")
 
             return True
         except Exception as e:
             # 실패 시 콜백 제거
-            if topic in self._subscriptions and callback in self._subscriptions[topic]:
-                self._subscriptions[topic].remove(callback)
-                if not self._subscriptions[topic]:
-                    del self._subscriptions[topic]
+            self._remove_callback(topic, callback)
             raise ProtocolValidationError(f"[{self.client_config.client_id}] 구독 오류: {e}")
 
+    def _remove_callback(self, topic: str, callback: Callable[[str, bytes], None]) -> bool:
+        """
+        토픽에서 콜백 하나를 제거합니다. 같은 콜백이 여러 번 등록되어 있으면 하나만 제거합니다.
+
+        Args:
+            topic (str): 대상 토픽
+            callback (Callable): 제거할 콜백
+
+        Returns:
+            bool: 콜백 제거 후 토픽에 남은 콜백이 없어 토픽이 삭제되었으면 True
+        """
+        with self._subs_lock:
+            callbacks = self._subscriptions.get(topic, ())
+            try:
+                index = callbacks.index(callback)
+            except ValueError:
+                return False
+            remaining = callbacks[:index] + callbacks[index + 1:]
+            self._set_callbacks(topic, remaining)
+            return not remaining
+
+    def _set_callbacks(self, topic: str, callbacks: tuple[Callable, ...]):
+        """
+        토픽 하나의 콜백 튜플을 교체합니다. 빈 튜플이면 토픽을 제거합니다.
+        _subs_lock을 잡은 상태에서 호출해야 하며, 딕셔너리를 새로 만들어 교체하므로
+        handle_message는 락 없이 항상 일관된 스냅샷을 읽습니다.
+
+        Args:
+            topic (str): 갱신할 토픽
+            callbacks (tuple[Callable, ...]): 새 콜백 튜플
+        Returns:
+            None
+        """
+        subscriptions = dict(self._subscriptions)
+        if callbacks:
+            subscriptions[topic] = callbacks
+        else:
+            subscriptions.pop(topic, None)
+        if is_wildcard_filter(topic):
+            self._wildcards.set(topic, callbacks)
+        self._subscriptions = subscriptions
+
     def unsubscribe(self, topic: str, callback: Callable[[str, bytes], None] = None) -> bool:
         """
         구독 해제
@@ -413,31 +577,34 @@ class MQTTProtocol(PubSubProtocol):
             bool: 해제 성공 여부
         """
         try:
-            if topic not in self._subscriptions:
-                return True
-
             if callback is None:
                 # 모든 콜백 제거
-                del self._subscriptions[topic]
+                with self._subs_lock:
+                    if topic not in self._subscriptions:
+                        return True
+                    self._set_callbacks(topic, ())
                 result, _ = self.client.unsubscribe(topic)
                 if result != MQTT_ERR_SUCCESS:
                     raise ProtocolValidationError(f"[{self.client_config.client_id}] 구독 해제 실패: {result}")
             else:
-                # 특정 콜백만 제거
-                if callback in self._subscriptions[topic]:
-                    self._subscriptions[topic].remove(callback)
-                    # 콜백이 모두 제거되면 토픽 구독 해제
-                    if not self._subscriptions[topic]:
-                        del self._subscriptions[topic]
-                        result, _ = self.client.unsubscribe(topic)
-                        if result != MQTT_ERR_SUCCESS:
-                            raise ProtocolValidationError(f"[{self.client_config.client_id}] 구독 해제 실패: {result}")
+                # 특정 콜백만 제거 - 콜백이 모두 제거되면 토픽 구독 해제
+                if self._remove_callback(topic, callback):
+                    result, _ = self.client.unsubscribe(topic)
+                    if result != MQTT_ERR_SUCCESS:
+                        raise ProtocolValidationError(f"[{self.client_config.client_id}] 구독 해제 실패: {result}")
 
             return True
         except Exception as e:
-            logging.error(f"Unsubscribe error: {e}")
+            logger.error("Unsubscribe error: %s", e)
             raise ProtocolValidationError(f"[{self.client_config.client_id}] 구독 해제 오류: {e}")
 
+    def _start_callback_pool(self):
+        """구독 콜백 실행용 스레드 풀 생성 (이미 있으면 재사용, dispatch_workers=0이면 생성하지 않음)"""
+        workers = self.broker_config.dispatch_workers
+        with self._cb_pool_lock:
+            if self._cb_pool is None and workers > 0:
+                self._cb_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mqtt-cb")
+
     def _start_reconnect_thread(self):
         """재연결 스레드 시작"""
         if self._reconnect_thread and self._reconnect_thread.is_alive():
@@ -446,7 +613,7 @@ class MQTTProtocol(PubSubProtocol):
         self._stop_reconnect.clear()
         self._reconnect_thread = threading.Thread(target=self._reconnect_loop, daemon=True)
         self._reconnect_thread.start()
-        logging.info(f"[{self.client_config.client_id}] 자동 재연결 스레드 시작")
+        logger.info("[%s] 자동 재연결 스레드 시작", self.client_config.client_id)
 
     def _reconnect_loop(self):
         """재연결 루프 (지수 백오프)"""
@@ -458,28 +625,26 @@ class MQTTProtocol(PubSubProtocol):
                 break
 
             try:
-                logging.info(f"[{self.client_config.client_id}] 재연결 시도... (대기시간: {delay}초)")
+                logger.info("[%s] 재연결 시도... (대기시간: %s초)", self.client_config.client_id, delay)
                 self.client.reconnect()
 
                 if self.broker_config.mode == "non-blocking":
                     self.client.loop_start()
 
                 # 연결 확인
-                for _ in range(10):
-                    if self._is_connected:
-                        logging.info(f"[{self.client_config.client_id}] 재연결 성공")
-                        return
-                    time.sleep(0.5)
+                if self._connected_event.wait(timeout=self.broker_config.connect_timeout):
+                    logger.info("[%s] 재연결 성공", self.client_config.client_id)
+                    return
 
             except Exception as e:
-                logging.warning(f"[{self.client_config.client_id}] 재연결 실패: {e}")
+                logger.warning("[%s] 재연결 실패: %s", self.client_config.client_id, e)
 
             # 지수 백오프
             if self._stop_reconnect.wait(delay):
                 break
             delay = min(delay * 2, max_delay)
 
-        logging.info(f"[{self.client_config.client_id}] 재연결 스레드 종료")
+        logger.info("[%s] 재연결 스레드 종료", self.client_config.client_id)
 
 if __name__ == "__main__":
     import logging
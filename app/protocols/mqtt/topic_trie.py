@@ -0,0 +1,133 @@
+from typing import Callable, Dict, Tuple
+
+SINGLE_LEVEL_WILDCARD = "+"
+MULTI_LEVEL_WILDCARD = "#"
+
+
+def is_wildcard_filter(topic_filter: str) -> bool:
+    """
+    토픽 필터에 MQTT 와일드카드('+', '#')가 포함되어 있는지 확인합니다.
+
+    Args:
+        topic_filter (str): 구독 토픽 필터
+    Returns:
+        bool: 와일드카드 포함 여부
+    """
+    return SINGLE_LEVEL_WILDCARD in topic_filter or MULTI_LEVEL_WILDCARD in topic_filter
+
+
+class _Node:
+    """트라이 노드 - 하위 레벨 노드와 이 필터에 등록된 콜백 튜플"""
+
+    __slots__ = ("children", "callbacks")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.callbacks: Tuple[Callable, ...] = ()
+
+
+class TopicTrie:
+    """
+    MQTT 토픽 필터를 레벨('/') 단위 트라이로 저장하고, 수신 토픽과 일치하는 콜백을 찾습니다.
+
+    - '+'는 한 레벨, '#'는 현재 레벨 이하 전체(상위 레벨 자체 포함)와 일치합니다.
+    - '$'로 시작하는 토픽은 첫 레벨의 와일드카드와 일치하지 않습니다. (MQTT 규격)
+    - set()은 호출 측 락으로 직렬화해야 합니다. match()는 dict 조회만 하므로
+      set()과 동시에 호출되어도 안전하며, 콜백은 불변 튜플로 교체됩니다.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self):
+        self._root = _Node()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """콜백이 등록된 토픽 필터 수"""
+        return self._size
+
+    def set(self, topic_filter: str, callbacks: Tuple[Callable, ...]):
+        """
+        토픽 필터의 콜백 튜플을 교체합니다. 빈 튜플이면 필터를 제거합니다.
+
+        Args:
+            topic_filter (str): 구독 토픽 필터
+            callbacks (Tuple[Callable, ...]): 등록할 콜백 튜플
+        Returns:
+            None
+        """
+        levels = topic_filter.split("/")
+        if not callbacks:
+            self._discard(levels)
+            return
+
+        node = self._root
+        for level in levels:
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _Node()
+            node = child
+
+        if not node.callbacks:
+            self._size += 1
+        node.callbacks = tuple(callbacks)
+
+    def _discard(self, levels: list):
+        """필터를 제거하고, 콜백과 하위 노드가 모두 없는 노드를 잎에서부터 정리합니다."""
+        path = [self._root]
+        for level in levels:
+            node = path[-1].children.get(level)
+            if node is None:
+                return
+            path.append(node)
+
+        if not path[-1].callbacks:
+            return
+        path[-1].callbacks = ()
+        self._size -= 1
+
+        for depth in range(len(levels), 0, -1):
+            node = path[depth]
+            if node.callbacks or node.children:
+                break
+            del path[depth - 1].children[levels[depth - 1]]
+
+    def match(self, topic: str) -> Tuple[Callable, ...]:
+        """
+        수신 토픽과 일치하는 모든 필터의 콜백을 반환합니다.
+
+        Args:
+            topic (str): 수신한 메시지의 토픽 (와일드카드 없음)
+        Returns:
+            Tuple[Callable, ...]: 일치하는 콜백 (여러 필터에 일치하면 필터마다 포함)
+        """
+        levels = topic.split("/")
+        count = len(levels)
+        system_topic = topic.startswith("$")
+        matched = []
+
+        stack = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            children = node.children
+            allow_wildcard = not (system_topic and depth == 0)
+
+            if allow_wildcard:
+                multi = children.get(MULTI_LEVEL_WILDCARD)
+                if multi is not None:
+                    matched.extend(multi.callbacks)
+
+            if depth == count:
+                matched.extend(node.callbacks)
+                continue
+
+            child = children.get(levels[depth])
+            if child is not None:
+                stack.append((child, depth + 1))
+
+            if allow_wildcard:
+                single = children.get(SINGLE_LEVEL_WILDCARD)
+                if single is not None:
+                    stack.append((single, depth + 1))
+
+        return tuple(matched)
@@ -1,3 +1,2 @@
-from lib.communication.worker.listener import Listener, ListenerEvent
-from lib.communication.worker.requester import Requester, RequesterEvent
-
+from .listener import Listener, ListenerEvent
+from .requester import Requester, RequesterEvent
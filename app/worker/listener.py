@@ -1,9 +1,11 @@
 import abc
-import time
+import logging
 import threading
+from typing import Type
 from lib.communication.protocol.interface import Protocol
 from lib.communication.data import ReceivedData, PacketStructure
-from src.logger import AppLogger  # TODO : src 의존성 제거하기
+
+logger = logging.getLogger(__name__)
 
 
 class ListenerEvent(abc.ABC):
@@ -24,16 +26,19 @@ class Listener(threading.Thread):
 
     def __init__(self,
                  event_callback: ListenerEvent,
-                 packet_structure_impl: PacketStructureInterface, 
-                 protocol: Protocol):
+                 packet_structure_impl: Type[PacketStructure],
+                 protocol: Protocol,
+                 idle_wait_time: float = 0.01):
         super().__init__()
         self._protocol = protocol
         self._stop_flag = threading.Event()
+        # 수신 데이터가 없을 때 대기 시간 - stop_flag로 대기하므로 stop() 호출 시 즉시 깨어남
+        self._idle_wait_time = idle_wait_time
         self._event_callback = event_callback
         self._packet_structure = packet_structure_impl
 
     def stop(self):
-        AppLogger.write_debug(self, "Set Stop flag for Tcp Listener")
+        logger.debug("Set Stop flag for Tcp Listener")
         self._stop_flag.set()
 
     def run(self) -> None:
@@ -43,30 +48,36 @@ class Listener(threading.Thread):
         if not isinstance(self._event_callback, ListenerEvent):
             raise ValueError(f"Event callback is not initialized in {self}")
 
-        while not self._stop_flag.is_set():
+        # 수신 루프에서 매 패킷마다 속성 조회를 반복하지 않도록 미리 바인딩
+        stop_is_set = self._stop_flag.is_set
+        read = self._protocol.read
+        is_valid = self._packet_structure.is_valid
+        split_packet = PacketStructure.split_packet
+        from_packet = PacketStructure.from_packet_trusted
+        from_bytes = ReceivedData.from_bytes
+        on_received = self._event_callback.on_received
+        wait_stop = self._stop_flag.wait
+        idle_wait_time = self._idle_wait_time
+
+        while not stop_is_set():
             try:
-                is_ok, bytes_data = self._protocol.read()
+                is_ok, bytes_data = read()
                 packets = []
                 if not is_ok:
                     self._event_callback.on_failed_recv(bytes_data)
                     self._event_callback.on_disconnected(bytes_data)
                 elif bytes_data is None:
-                    time.sleep(0.01)
+                    wait_stop(idle_wait_time)
                     continue
-                elif not self._packet_structure.is_valid(bytes_data):
-                    packets = PacketStructure.split_packet(bytes_data)
+                elif not is_valid(bytes_data):
+                    packets = split_packet(bytes_data)
                 else:
                     packets = [bytes_data]
 
                 for packet in packets:
-                    self._event_callback.on_received(
-                        ReceivedData.from_bytes(
-                            PacketStructure.from_packet(packet)
-                        )
-                    )
-            except Exception as e:
-                import traceback
-                traceback.print_exc()
+                    on_received(from_bytes(from_packet(packet)))
+            except Exception:
+                logger.exception("Error in Listener loop")
 
         self._protocol.disconnect()
-        AppLogger.write_debug(self, "Terminated Tcp Listener Thread")
+        logger.debug("Terminated Tcp Listener Thread")
@@ -1,12 +1,13 @@
 import abc
-import time
-import queue
+import logging
 import threading
-import traceback
-from typing import Optional
+import collections
+from typing import List, Optional
 from lib.communication.protocol.interface import Protocol
 from lib.communication.data import SendData, PacketStructure
 
+logger = logging.getLogger(__name__)
+
 
 class RequesterEvent(abc.ABC):
     @abc.abstractmethod
@@ -26,27 +27,54 @@ class Requester(threading.Thread):
     def __init__(self,
                  event_callback: RequesterEvent,
                  protocol: Protocol,
-                 request_queue: queue.Queue,
-                 conf_file_path: str = "./public/network.ini",):
+                 request_queue: collections.deque,
+                 conf_file_path: str = "./public/network.ini",
+                 queue_wait_time: float = 0.1,
+                 batch_size: int = 32,
+                 queue_event: Optional[threading.Event] = None):
         super().__init__()
         self._network_config_file_path = conf_file_path
         self._protocol = protocol
         self._stop_flag = threading.Event()
         self._event_callback = event_callback
         self._request_queue = request_queue
+        # 생산자가 요청 추가 후 설정하는 이벤트 - 없으면 queue_wait_time 간격으로 큐를 확인
+        self._queue_event = queue_event if queue_event is not None else threading.Event()
+        self._queue_wait_time = queue_wait_time
+        self._batch_size = max(1, batch_size)
 
     def stop(self):
         self._stop_flag.set()
+        self._queue_event.set()
+
+    def _wait_for_request(self):
+        # 큐가 비어 있을 때만 대기. clear() 후 큐를 다시 확인하므로 알림이 유실되지 않음
+        if not self._request_queue:
+            self._queue_event.wait(timeout=self._queue_wait_time)
+            self._queue_event.clear()
 
     def next(self) -> Optional[SendData]:
+        self._wait_for_request()
         try:
-            data = self._request_queue.get_nowait()
+            data = self._request_queue.popleft()
+        except IndexError:
+            return None
+        if isinstance(data, SendData):
+            return data
+
+    def next_batch(self) -> List[SendData]:
+        # 첫 요청이 올 때까지 대기한 뒤, 쌓여 있는 요청을 최대 batch_size개까지 한 번에 꺼냄
+        self._wait_for_request()
+        batch = []
+        popleft = self._request_queue.popleft
+        while len(batch) < self._batch_size:
+            try:
+                data = popleft()
+            except IndexError:
+                break
             if isinstance(data, SendData):
-                return data
-        except queue.Empty:
-            pass
-        except Exception as e:
-            traceback.format_exc()
+                batch.append(data)
+        return batch
 
     def run(self) -> None:
         if not isinstance(self._protocol, Protocol):
@@ -55,25 +83,51 @@ class Requester(threading.Thread):
         if not isinstance(self._event_callback, RequesterEvent):
             raise ValueError(f"Event callback is not initialized in {self}")
 
-        while not self._stop_flag.is_set():
-            time.sleep(0.0001)
+        # 송신 루프에서 반복되는 속성 조회를 미리 바인딩
+        stop_is_set = self._stop_flag.is_set
+        next_batch = self.next_batch
+        send = self._protocol.send
+        to_packets = PacketStructure.to_packets_from_parts
+        on_sent = self._event_callback.on_sent
+        on_failed_send = self._event_callback.on_failed_send
+
+        while not stop_is_set():
             try:
-                send_data = self.next()
+                batch = next_batch()
+
+                if not batch:
+                    continue
+
+                # 요청별로 프레임을 만들어, 변환에 실패한 요청만 실패 처리하고 나머지는 송신
+                frames = []
+                sendable = []
+                for send_data in batch:
+                    try:
+                        frames.append(send_data.to_parts())
+                    except Exception:
+                        logger.exception("Failed to build packet - %r", send_data)
+                        on_failed_send(send_data)
+                        continue
+                    sendable.append(send_data)
 
-                if send_data is None:
+                if not sendable:
                     continue
 
-                result = self._protocol.send(
-                    PacketStructure.to_packet(
-                        send_data.to_bytes()
-                    )
-                )
+                # 배치 전체를 하나의 버퍼로 만들어 send 호출(시스템 콜)을 한 번으로 줄임
+                try:
+                    result = send(to_packets(frames))
+                except Exception:
+                    logger.exception("Failed to send %d request(s)", len(sendable))
+                    result = False
 
                 if result:
-                    self._event_callback.on_sent(send_data)
+                    for send_data in sendable:
+                        on_sent(send_data)
                 else:
-                    self._event_callback.on_failed_send(send_data)
-                    self._event_callback.on_disconnected(send_data)
+                    for send_data in sendable:
+                        on_failed_send(send_data)
+                    # 연결 끊김은 배치당 한 번만 알림
+                    self._event_callback.on_disconnected(sendable[0])
 
-            except Exception as e:
-                traceback.print_exc()
+            except Exception:
+                logger.exception("Error in Requester loop")
@@ -117,7 +117,7 @@ def test_queue_functionality():
     # 연결되지 않은 상태에서 메시지 발행
     result = mqtt.publish("test/queue", "queued message")
 
-    if not result and not mqtt._publish_queue.empty():
+    if not result and mqtt._publish_queue:
         print("✅ 메시지가 큐에 저장됨")
     else:
         print("❌ 큐 기능 오류")
@@ -126,7 +126,7 @@ def test_queue_functionality():
     mqtt.connect()
     time.sleep(3)
 
-    if mqtt.is_connected and mqtt._publish_queue.empty():
+    if mqtt.is_connected and not mqtt._publish_queue:
         print("✅ 연결 후 큐가 비워짐")
     else:
         print("⚠️ 큐 비우기 실패")
@@ -156,7 +156,7 @@ def test_real_mqtt_queue_persistence(protocol):
     test_message = "Queued message test"
     result = protocol.publish(test_topic, test_message)
     assert result is False
-    assert not protocol._publish_queue.empty()
+    assert protocol._publish_queue
 
     protocol.connect()
     time.sleep(3)
@@ -166,7 +166,7 @@ def test_real_mqtt_queue_persistence(protocol):
 
     # 큐가 비워질 때까지 대기
     time.sleep(2)
-    assert protocol._publish_queue.empty()
+    assert not protocol._publish_queue
 
     # 메시지 수신 확인
     time.sleep(2)
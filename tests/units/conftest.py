@@ -0,0 +1,53 @@
+import importlib
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+
+import app.common.params
+import app.data
+from app.interfaces.protocol import ReqResProtocol
+
+
+def _stub_module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+def _create_protocol(params):
+    raise NotImplementedError("테스트에서 create_protocol을 대체해야 합니다.")
+
+
+# app/network.py, app/worker/*는 레거시 lib.communication/src 경로로 의존성을 가져오므로,
+# 이 트리에 없는 모듈만 같은 역할의 app 모듈로 대체합니다. (테스트 간에 같은 객체를 재사용)
+_LEGACY_STUBS = {
+    "lib.communication.data": app.data,
+    "lib.communication.protocol.interface": _stub_module(
+        "lib.communication.protocol.interface", Protocol=ReqResProtocol
+    ),
+    "lib.communication.protocol.factory": _stub_module(
+        "lib.communication.protocol.factory", create_protocol=_create_protocol
+    ),
+    "src.configure": app.common.params,
+}
+
+
+@pytest.fixture
+def legacy_modules(monkeypatch):
+    """
+    누락된 lib.communication/src 의존성만 sys.modules에 대체 등록한 뒤
+    테스트 대상인 app.worker.listener, app.worker.requester, app.network 모듈을 반환하는 fixture
+    """
+    for name, module in _LEGACY_STUBS.items():
+        monkeypatch.setitem(sys.modules, name, module)
+
+    worker = importlib.import_module("app.worker")
+    monkeypatch.setitem(sys.modules, "lib.communication.worker", worker)
+
+    return SimpleNamespace(
+        listener=importlib.import_module("app.worker.listener"),
+        requester=importlib.import_module("app.worker.requester"),
+        network=importlib.import_module("app.network"),
+    )
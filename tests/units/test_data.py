@@ -0,0 +1,126 @@
+import dataclasses
+
+import pytest
+
+from app.data import PacketStructure, ReceivedData, SendData
+
+
+@pytest.mark.unit
+def test_send_data_to_bytes():
+    """bytes로 생성한 SendData가 '#' 구분자로 직렬화되는지 확인"""
+    data = SendData(b"CMD", (b"1", b"2"))
+    assert data.to_bytes() == b"CMD#1#2"
+    assert b"".join(data.to_parts()) == b"CMD#1#2"
+
+
+@pytest.mark.unit
+def test_send_data_without_data():
+    """data 없이 생성한 SendData는 cmd만 직렬화되는지 확인"""
+    assert SendData(b"CMD").to_bytes() == b"CMD"
+
+
+@pytest.mark.unit
+def test_send_data_accepts_str_and_list():
+    """기존 str/List[str] 호출이 생성 시점에 bytes/튜플로 변환되는지 확인"""
+    data = SendData("cmd", ["x", "한글"])
+    assert data.cmd == b"cmd"
+    assert data.data == (b"x", "한글".encode("utf-8"))
+    assert data.to_bytes() == "cmd#x#한글".encode("utf-8")
+
+
+@pytest.mark.unit
+def test_send_data_accepts_non_str_items():
+    """int 등 문자열이 아닌 항목도 기존 f-string 포맷과 같이 변환되는지 확인"""
+    data = SendData("cmd", [1, 2.5, True])
+    assert data.to_bytes() == b"cmd#1#2.5#True"
+
+
+@pytest.mark.unit
+def test_send_data_invalid_data_raises_at_construction():
+    """순회할 수 없는 data는 송신 시점이 아닌 생성 시점에 예외가 발생하는지 확인"""
+    with pytest.raises(TypeError):
+        SendData("cmd", 5)
+
+
+@pytest.mark.unit
+def test_send_data_str_accessors():
+    """cmd_str/data_str이 UTF-8 문자열로 디코딩된 값을 반환하는지 확인"""
+    data = SendData(b"cmd", (b"a", b"b"))
+    assert data.cmd_str == "cmd"
+    assert data.data_str == ("a", "b")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("raw, cmd, items", [
+    (b"CMD", b"CMD", ()),
+    (b"CMD#1#2", b"CMD", (b"1", b"2")),
+    (b"CMD#", b"CMD", (b"",)),
+    (memoryview(b"CMD#x"), b"CMD", (b"x",)),
+])
+def test_received_data_from_bytes(raw, cmd, items):
+    """수신 바이트가 cmd와 data 튜플로 분리되는지 확인"""
+    received = ReceivedData.from_bytes(raw)
+    assert received.cmd == cmd
+    assert received.data == items
+
+
+@pytest.mark.unit
+def test_received_data_accepts_str_and_list():
+    """ReceivedData도 str/List[str]로 직접 생성할 수 있는지 확인"""
+    received = ReceivedData("cmd", ["a", "b"])
+    assert received == ReceivedData(b"cmd", (b"a", b"b"))
+    assert received.cmd_str == "cmd"
+    assert received.data_str == ("a", "b")
+
+
+@pytest.mark.unit
+def test_data_classes_are_frozen():
+    """생성 후 필드를 변경할 수 없는지 확인"""
+    data = SendData(b"cmd")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        data.cmd = b"other"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("packet, expected", [
+    (b"$abc$", [b"$abc$"]),
+    (b"$abc$$def$", [b"$abc$", b"$def$"]),
+    (b"$abc$def$", [b"$abc$", b"$def$"]),
+    (b"x$abc$", [b"$x$", b"$abc$"]),
+    (b"abc$", [b"$abc$"]),
+    (b"$$", []),
+    (b"", []),
+])
+def test_split_packet(packet, expected):
+    """split_packet이 머리 바이트 기준으로 프레임을 나누는지 확인"""
+    frames = PacketStructure.split_packet(packet)
+    assert frames == expected
+    assert all(type(frame) is bytes for frame in frames)
+
+
+@pytest.mark.unit
+def test_split_packet_round_trip():
+    """to_packets_from_parts로 합친 프레임이 split_packet으로 다시 분리되는지 확인"""
+    items = [SendData(b"A", (b"1",)), SendData(b"B")]
+    joined = PacketStructure.to_packets_from_parts(item.to_parts() for item in items)
+    frames = PacketStructure.split_packet(joined)
+    assert [ReceivedData.from_bytes(PacketStructure.from_packet(f)) for f in frames] == [
+        ReceivedData(b"A", (b"1",)),
+        ReceivedData(b"B", ()),
+    ]
+
+
+@pytest.mark.unit
+def test_from_packet_returns_bytes():
+    """from_packet/from_packet_trusted가 머리/꼬리를 뗀 bytes를 반환하는지 확인"""
+    for from_packet in (PacketStructure.from_packet, PacketStructure.from_packet_trusted):
+        payload = from_packet(b"$CMD#1$")
+        assert type(payload) is bytes
+        assert payload == b"CMD#1"
+
+
+@pytest.mark.unit
+def test_from_packet_invalid_raises():
+    """구조가 잘못된 패킷은 ValueError가 발생하는지 확인"""
+    with pytest.raises(ValueError):
+        PacketStructure.from_packet(b"$abc$$def$")
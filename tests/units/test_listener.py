@@ -0,0 +1,139 @@
+import threading
+import time
+
+import pytest
+
+from app.data import PacketStructure, ReceivedData
+from app.interfaces.protocol import ReqResProtocol
+
+
+class FakeProtocol(ReqResProtocol):
+    """미리 넣어 둔 read 결과를 차례로 반환하고, 없으면 수신 데이터 없음을 반환하는 프로토콜"""
+
+    def __init__(self, reads=()):
+        self.reads = list(reads)
+        self.disconnected = threading.Event()
+
+    def connect(self):
+        return True
+
+    def disconnect(self):
+        self.disconnected.set()
+
+    def send(self, data):
+        return True
+
+    def read(self):
+        if self.reads:
+            return self.reads.pop(0)
+        return True, None
+
+
+class RecordingEvent:
+    """Listener 이벤트 호출을 기록 (fixture에서 ListenerEvent로 등록)"""
+
+    def __init__(self):
+        self.received = []
+        self.failed = []
+        self.disconnected = []
+
+    def on_received(self, received_data):
+        self.received.append(received_data)
+
+    def on_failed_recv(self, data):
+        self.failed.append(data)
+
+    def on_disconnected(self, data):
+        self.disconnected.append(data)
+
+
+@pytest.fixture
+def listener_factory(legacy_modules):
+    """
+    FakeProtocol/RecordingEvent로 Listener를 생성하고, 테스트 종료 시 스레드를 정리하는 fixture
+    """
+    Listener = legacy_modules.listener.Listener
+    legacy_modules.listener.ListenerEvent.register(RecordingEvent)
+    created = []
+
+    def factory(reads=(), **kwargs):
+        protocol = FakeProtocol(reads)
+        event = RecordingEvent()
+        listener = Listener(
+            event_callback=event,
+            packet_structure_impl=PacketStructure,
+            protocol=protocol,
+            **kwargs
+        )
+        created.append(listener)
+        return listener, protocol, event
+
+    yield factory
+
+    for listener in created:
+        listener.stop()
+        if listener.is_alive():
+            listener.join(timeout=1)
+
+
+def wait_until(predicate, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.001)
+    return predicate()
+
+
+@pytest.mark.unit
+def test_run_delivers_single_packet(listener_factory):
+    """
+    프레임 하나를 수신하면 ReceivedData로 변환해 on_received를 호출하는지 테스트
+    """
+    listener, _, event = listener_factory(reads=[(True, b"$CMD#1$")])
+    listener.start()
+
+    assert wait_until(lambda: event.received)
+    assert event.received == [ReceivedData(b"CMD", (b"1",))]
+
+
+@pytest.mark.unit
+def test_run_splits_joined_packets(listener_factory):
+    """
+    여러 프레임이 한 번에 수신되면 프레임마다 on_received를 호출하는지 테스트
+    """
+    listener, _, event = listener_factory(reads=[(True, b"$A#1$$B$")])
+    listener.start()
+
+    assert wait_until(lambda: len(event.received) == 2)
+    assert event.received == [ReceivedData(b"A", (b"1",)), ReceivedData(b"B", ())]
+
+
+@pytest.mark.unit
+def test_run_reports_read_failure(listener_factory):
+    """
+    read 실패 시 on_failed_recv와 on_disconnected를 호출하는지 테스트
+    """
+    listener, _, event = listener_factory(reads=[(False, b"")])
+    listener.start()
+
+    assert wait_until(lambda: event.disconnected)
+    assert event.failed == [b""]
+    assert event.disconnected == [b""]
+
+
+@pytest.mark.unit
+def test_stop_wakes_idle_listener(listener_factory):
+    """
+    수신 데이터가 없어 대기 중인 Listener가 stop() 호출 시 즉시 종료되고 프로토콜 연결을 해제하는지 테스트
+    """
+    listener, protocol, _ = listener_factory(idle_wait_time=5)
+    listener.start()
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    listener.stop()
+    listener.join(timeout=1)
+    assert not listener.is_alive()
+    assert time.monotonic() - started < 1
+    assert protocol.disconnected.is_set()
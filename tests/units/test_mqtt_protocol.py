@@ -1,3 +1,6 @@
+import threading
+import time
+
 import pytest
 from unittest.mock import MagicMock
 from app.protocols.mqtt.mqtt_protocol import MQTTProtocol, BrokerConfig, ClientConfig
@@ -29,7 +32,8 @@ def non_blocking_protocol(mock_client):
     config = BrokerConfig(
         broker_address="broker.emqx.io",
         port=1883,
-        mode="non-blocking"
+        mode="non-blocking",
+        connect_timeout=0.01
     )
     client_config = ClientConfig()
     return MQTTProtocol(config, client_config)
@@ -43,7 +47,8 @@ def blocking_protocol(mock_client):
     config = BrokerConfig(
         broker_address="broker.emqx.io",
         port=1883,
-        mode="blocking"
+        mode="blocking",
+        connect_timeout=0.01
     )
     client_config = ClientConfig()
     return MQTTProtocol(config, client_config)
@@ -60,7 +65,8 @@ def protocol_factory(monkeypatch):
             client_customizer(mock_client)
         monkeypatch.setattr(mqtt_mod, "Client",
                             lambda *a, **k: mock_client)
-        cfg = BrokerConfig(broker_address="broker.emqx.io", mode=mode)
+        # 브로커 응답이 오지 않는 Mock 환경에서 연결 대기가 길어지지 않도록 단축
+        cfg = BrokerConfig(broker_address="broker.emqx.io", mode=mode, connect_timeout=0.01)
         return MQTTProtocol(cfg, ClientConfig()), mock_client
     return _factory
 
@@ -242,8 +248,8 @@ def test_publish_not_connected(protocol_factory, mode):
 
     # 검증: 반환값, 큐 적재, 실제 publish 미호출
     assert result is False
-    assert not protocol._publish_queue.empty()
-    topic, message, qos, retain = protocol._publish_queue.get_nowait()
+    assert protocol._publish_queue
+    topic, message, qos, retain = protocol._publish_queue.popleft()
     assert (topic, message, qos, retain) == ("topic", "offline", 0, False)
     client.publish.assert_not_called()
 
@@ -260,6 +266,44 @@ def test_publish_error(protocol_factory, mode):
     assert protocol.publish("topic", "message") is False
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["non-blocking", "blocking"])
+def test_publish_all(protocol_factory, mode):
+    """
+    여러 메시지 일괄 발행 테스트 - 메시지별 결과 반환
+    """
+    protocol, client = protocol_factory(mode)
+    protocol._is_connected = True
+    ok, fail = MagicMock(rc=0), MagicMock(rc=1)
+    client.publish.side_effect = [ok, fail, Exception("발행 오류")]
+
+    results = protocol.publish_all([
+        ("a", "1", 0, False),
+        ("b", "2", 1, False),
+        ("c", "3", 0, True),
+    ])
+
+    assert results == [True, False, False]
+    assert client.publish.call_count == 3
+    client.publish.assert_any_call("b", "2", 1, False)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["non-blocking", "blocking"])
+def test_publish_all_not_connected(protocol_factory, mode):
+    """
+    연결되지 않은 상태에서 일괄 발행 시 모두 큐에 추가되는지 테스트
+    """
+    protocol, client = protocol_factory(mode)
+    protocol._is_connected = False
+
+    results = protocol.publish_all([("a", "1", 0, False), ("b", "2", 1, True)])
+
+    assert results == [False, False]
+    assert len(protocol._publish_queue) == 2
+    client.publish.assert_not_called()
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize("mode", ["non-blocking", "blocking"])
 def test_publish_queue_and_flush(protocol_factory, mode):
@@ -270,7 +314,22 @@ def test_publish_queue_and_flush(protocol_factory, mode):
     protocol._is_connected = False
     result = protocol.publish("topic", "message")
     assert result is False
-    assert not protocol._publish_queue.empty()
+    assert protocol._publish_queue
+
+
+@pytest.mark.unit
+def test_publish_queue_drops_oldest_when_full(monkeypatch):
+    """
+    발행 큐가 queue_max에 도달하면 가장 오래된 메시지를 버리고 개수를 세는지 테스트
+    """
+    monkeypatch.setattr(mqtt_mod, "Client", lambda *a, **k: MagicMock())
+    protocol = MQTTProtocol(BrokerConfig(broker_address="localhost", queue_max=2), ClientConfig())
+
+    for i in range(3):
+        assert protocol.publish("topic", f"m{i}") is False
+
+    assert [item[1] for item in protocol._publish_queue] == ["m1", "m2"]
+    assert protocol._dropped == 1
 
 
 @pytest.mark.unit
@@ -283,7 +342,7 @@ def test_publish_queue_empty_check(protocol_factory, mode):
     protocol._is_connected = False
     result = protocol.publish("topic", "message")
     assert result is False
-    assert not protocol._publish_queue.empty()
+    assert protocol._publish_queue
 
 
 @pytest.mark.unit
@@ -327,6 +386,48 @@ def test_subscribe_duplicate_callbacks_allowed(protocol_factory, mode):
     assert len(protocol._subscriptions["topic"]) == 2
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["non-blocking", "blocking"])
+def test_unsubscribe_duplicate_callback_removes_one(protocol_factory, mode):
+    """
+    중복 등록된 콜백을 해제하면 하나만 제거되고 토픽 구독은 유지되는지 테스트
+    """
+    protocol, client = protocol_factory(mode)
+    client.subscribe.return_value = (0, 1)
+    cb = lambda t,m: None
+    protocol.subscribe("topic", cb)
+    protocol.subscribe("topic", cb)
+
+    protocol.unsubscribe("topic", cb)
+    assert protocol._subscriptions["topic"] == (cb,)
+    client.subscribe.assert_called_once_with(topic="topic", qos=0)
+    client.unsubscribe.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["non-blocking", "blocking"])
+def test_subscribe_does_not_mutate_snapshot(protocol_factory, mode):
+    """
+    구독 변경 시 기존 구독 딕셔너리를 수정하지 않고 새 딕셔너리로 교체하는지 테스트
+    """
+    protocol, client = protocol_factory(mode)
+    client.subscribe.return_value = (0, 1)
+    client.unsubscribe.return_value = (0, 1)
+    cb1 = lambda t, m: None
+    cb2 = lambda t, m: None
+    protocol.subscribe("topic", cb1)
+    snapshot = protocol._subscriptions
+
+    protocol.subscribe("topic", cb2)
+    assert snapshot == {"topic": (cb1,)}
+    assert protocol._subscriptions == {"topic": (cb1, cb2)}
+
+    snapshot = protocol._subscriptions
+    protocol.unsubscribe("topic", cb1)
+    assert snapshot == {"topic": (cb1, cb2)}
+    assert protocol._subscriptions == {"topic": (cb2,)}
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize("mode", ["non-blocking", "blocking"])
 def test_unsubscribe_success(protocol_factory, mode):
@@ -334,7 +435,7 @@ def test_unsubscribe_success(protocol_factory, mode):
     구독 해제 성공 테스트
     """
     protocol, client = protocol_factory(mode)
-    protocol._subscriptions["topic"] = [lambda t, m: None]
+    protocol._subscriptions["topic"] = ((lambda t, m: None),)
     client.unsubscribe.return_value = (0, 1)
     assert protocol.unsubscribe("topic")
 
@@ -346,7 +447,7 @@ def test_unsubscribe_failure(protocol_factory, mode):
     구독 해제 실패 테스트
     """
     protocol, client = protocol_factory(mode)
-    protocol._subscriptions["bad"] = [lambda t, m: None]
+    protocol._subscriptions["bad"] = ((lambda t, m: None),)
     client.unsubscribe.return_value = (1, None)
     with pytest.raises(ProtocolValidationError):
         protocol.unsubscribe("bad")
@@ -360,7 +461,7 @@ def test_unsubscribe_exception_handling(protocol_factory, mode):
     """
     protocol, client = protocol_factory(mode)
     callback = lambda t, m: None
-    protocol._subscriptions["topic"] = [callback]
+    protocol._subscriptions["topic"] = (callback,)
     client.unsubscribe.side_effect = Exception("Unsubscribe failed")
     with pytest.raises(ProtocolValidationError, match="구독 해제 오류"):
         protocol.unsubscribe("topic")
@@ -374,7 +475,7 @@ def test_unsubscribe_all_callbacks_failure_keeps_local_state(protocol_factory, m
     """
     protocol, client = protocol_factory(mode)
     cb = lambda t,m: None
-    protocol._subscriptions["topic"] = [cb]
+    protocol._subscriptions["topic"] = (cb,)
     client.unsubscribe.return_value = (1, None)
     with pytest.raises(ProtocolValidationError):
         protocol.unsubscribe("topic")
@@ -389,7 +490,7 @@ def test_unsubscribe_specific_callback_unsubscribe_failure(protocol_factory, mod
     """
     protocol, client = protocol_factory(mode)
     callback = lambda t, m: None
-    protocol._subscriptions["topic"] = [callback]
+    protocol._subscriptions["topic"] = (callback,)
     client.unsubscribe.return_value = (1, None)
     with pytest.raises(ProtocolValidationError):
         protocol.unsubscribe("topic", callback)
@@ -441,7 +542,7 @@ def test_unsubscribe_callback_not_in_list(protocol_factory, mode):
     callback1 = lambda t, m: None
     callback2 = lambda t, m: None
 
-    protocol._subscriptions["topic"] = [callback1]
+    protocol._subscriptions["topic"] = (callback1,)
     assert protocol.unsubscribe("topic", callback2) is True
     assert "topic" in protocol._subscriptions
     assert callback1 in protocol._subscriptions["topic"]
@@ -466,7 +567,7 @@ def test_on_connect_callback(protocol_factory, mode):
     """
     protocol, client = protocol_factory(mode)
     callback = lambda t, m: None
-    protocol._subscriptions["topic"] = [callback]
+    protocol._subscriptions["topic"] = (callback,)
     client.subscribe.return_value = (0, 1)
     protocol._on_connect(client, protocol.handler, {}, 0)
     client.subscribe.assert_called_once_with(topic="topic", qos=0)
@@ -479,7 +580,7 @@ def test_on_connect_subscription_recovery_error(protocol_factory, mode):
     연결 시 구독 복구 오류 테스트
     """
     protocol, client = protocol_factory(mode)
-    protocol._subscriptions["topic1"] = [lambda t, m: None]
+    protocol._subscriptions["topic1"] = ((lambda t, m: None),)
     client.subscribe.side_effect = Exception("구독 복구 실패")
     protocol._on_connect(client, protocol.handler, {}, 0)
     assert protocol._is_connected is True
@@ -492,7 +593,7 @@ def test_on_connect_subscription_recovery_failure(protocol_factory, mode):
     연결 시 구독 복구 실패 테스트
     """
     protocol, client = protocol_factory(mode)
-    protocol._subscriptions["topic1"] = [lambda t, m: None]
+    protocol._subscriptions["topic1"] = ((lambda t, m: None),)
     client.subscribe.return_value = (1, None)
     protocol._on_connect(client, protocol.handler, {}, 0)
     assert protocol._is_connected is True
@@ -516,8 +617,8 @@ def test_on_connect_with_queue_messages(protocol_factory, mode):
     연결 시 큐에 메시지가 있을 때 테스트
     """
     protocol, client = protocol_factory(mode)
-    protocol._publish_queue.put(("topic", "message", 0, False))
-    assert not protocol._publish_queue.empty()
+    protocol._publish_queue.append(("topic", "message", 0, False))
+    assert protocol._publish_queue
     protocol._on_connect(client, protocol.handler, {}, 0)
     assert protocol._is_connected is True
     assert client.publish.called
@@ -531,8 +632,8 @@ def test_on_connect_partial_subscription_recovery(protocol_factory, mode):
     """
     protocol, client = protocol_factory(mode)
     protocol._subscriptions = {
-        "ok": [lambda t,m: None],
-        "bad": [lambda t,m: None],
+        "ok": ((lambda t,m: None),),
+        "bad": ((lambda t,m: None),),
     }
     def sub_side_effect(*args, **kwargs):
         return (0, 1) if kwargs.get("topic") == "ok" else (1, None)
@@ -568,7 +669,7 @@ def test_on_unsubscribe_error(protocol_factory, mode):
     _on_unsubscribe 오류 테스트
     """
     protocol, client = protocol_factory(mode)
-    protocol._subscriptions["topic"] = [lambda t, m: None]
+    protocol._subscriptions["topic"] = ((lambda t, m: None),)
     client.unsubscribe.side_effect = Exception("구독 해제 실패")
     with pytest.raises(ProtocolValidationError):
         protocol.unsubscribe("topic")
@@ -583,9 +684,10 @@ def test_on_message_callback(protocol_factory, mode):
     protocol, _ = protocol_factory(mode)
     called = []
     callback = lambda t, m: called.append((t, m))
-    protocol._subscriptions["topic"] = [callback]
+    protocol._subscriptions["topic"] = (callback,)
     msg = type("msg", (), {"topic": "topic", "payload": b"data"})
     protocol._on_message(None, protocol.handler, msg)
+    protocol._cb_pool.shutdown(wait=True)
     assert called[0] == ("topic", b"data")
 
 
@@ -597,7 +699,7 @@ def test_on_message_with_exception(protocol_factory, mode):
     """
     protocol, _ = protocol_factory(mode)
     error_callback = lambda t, m: 1 / 0
-    protocol._subscriptions["topic"] = [error_callback]
+    protocol._subscriptions["topic"] = (error_callback,)
     msg = type("msg", (), {"topic": "topic", "payload": b"data"})
     protocol._on_message(None, protocol.handler, msg)
 
@@ -620,7 +722,7 @@ def test_flush_publish_queue_failure(protocol_factory, mode):
     플러시 중 발행 실패 테스트
     """
     protocol, client = protocol_factory(mode)
-    protocol._publish_queue.put(("topic", "message", 0, False))
+    protocol._publish_queue.append(("topic", "message", 0, False))
     client.publish.return_value.rc = 1
     protocol.handler.handler_flush_publish_queue(client.publish)
 
@@ -632,7 +734,7 @@ def test_flush_publish_queue_error(protocol_factory, mode):
     플러시 중 오류 테스트
     """
     protocol, client = protocol_factory(mode)
-    protocol._publish_queue.put(("topic", "message", 0, False))
+    protocol._publish_queue.append(("topic", "message", 0, False))
     client.publish.side_effect = Exception("Publish error")
     protocol.handler.handler_flush_publish_queue(client.publish)
 
@@ -680,7 +782,7 @@ def test_handler_flush_publish_queue_failure(protocol_factory, mode):
     핸들러 플러시 시 재발행 실패 테스트
     """
     protocol, _ = protocol_factory(mode)
-    protocol._publish_queue.put(("topic", "message", 0, False))
+    protocol._publish_queue.append(("topic", "message", 0, False))
     def mock_publish_func(topic, message, qos, retain):
         return False
     protocol.handler.handler_flush_publish_queue(mock_publish_func)
@@ -911,9 +1013,10 @@ def test_handler_message_with_multiple_callbacks(protocol_factory, mode):
     def callback2(topic, payload):
         called_callbacks.append(("cb2", topic, payload))
 
-    protocol._subscriptions["test/topic"] = [callback1, callback2]
+    protocol._subscriptions["test/topic"] = (callback1, callback2)
 
     protocol.handler.handle_message("test/topic", b"test_data")
+    protocol._cb_pool.shutdown(wait=True)
 
     assert len(called_callbacks) == 2
     assert ("cb1", "test/topic", b"test_data") in called_callbacks
@@ -922,16 +1025,216 @@ def test_handler_message_with_multiple_callbacks(protocol_factory, mode):
 
 @pytest.mark.unit
 @pytest.mark.parametrize("mode", ["non-blocking", "blocking"])
-def test_handler_message_with_non_callable(protocol_factory, mode):
+def test_handler_message_callback_unsubscribes_itself(protocol_factory, mode):
+    """
+    콜백 실행 중 자신을 구독 해제해도 나머지 콜백이 모두 호출되는지 테스트
+    """
+    protocol, client = protocol_factory(mode)
+    client.subscribe.return_value = (0, 1)
+    client.unsubscribe.return_value = (0, 1)
+    called = []
+
+    def callback1(topic, payload):
+        called.append("cb1")
+        protocol.unsubscribe(topic, callback1)
+
+    def callback2(topic, payload):
+        called.append("cb2")
+
+    protocol.subscribe("test/topic", callback1)
+    protocol.subscribe("test/topic", callback2)
+
+    protocol.handler.handle_message("test/topic", b"test_data")
+    protocol._cb_pool.shutdown(wait=True)
+
+    assert sorted(called) == ["cb1", "cb2"]
+    assert protocol._subscriptions["test/topic"] == (callback2,)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["non-blocking", "blocking"])
+def test_handler_message_with_wildcard_subscription(protocol_factory, mode):
     """
-    호출 불가능한 콜백이 등록된 경우 테스트
+    와일드카드 토픽 구독 시 일치하는 메시지가 전달되는지 테스트
+    """
+    protocol, client = protocol_factory(mode)
+    client.subscribe.return_value = (0, 1)
+    client.unsubscribe.return_value = (0, 1)
+    called = []
+
+    def wildcard_cb(topic, payload):
+        called.append(("wildcard", topic))
+
+    def exact_cb(topic, payload):
+        called.append(("exact", topic))
+
+    protocol.subscribe("sensors/+/temp", wildcard_cb)
+    protocol.subscribe("sensors/1/temp", exact_cb)
+    client.subscribe.assert_any_call(topic="sensors/+/temp", qos=0)
+
+    protocol.handler.handle_message("sensors/1/temp", b"1")
+    protocol.handler.handle_message("sensors/2/temp", b"2")
+    protocol.handler.handle_message("sensors/2/humidity", b"3")
+    protocol._cb_pool.shutdown(wait=True)
+
+    assert sorted(called) == [
+        ("exact", "sensors/1/temp"),
+        ("wildcard", "sensors/1/temp"),
+        ("wildcard", "sensors/2/temp"),
+    ]
+
+    protocol.unsubscribe("sensors/+/temp", wildcard_cb)
+    assert len(protocol._wildcards) == 0
+
+
+@pytest.mark.unit
+def test_dispatch_workers_default_preserves_order(protocol_factory):
+    """
+    기본 설정에서 같은 토픽의 메시지 콜백이 수신 순서대로 하나씩 실행되는지 테스트
+    """
+    protocol, _ = protocol_factory()
+    assert protocol.broker_config.dispatch_workers == 1
+    received = []
+    running = []
+
+    def callback(topic, payload):
+        running.append(payload)
+        assert len(running) == 1
+        time.sleep(0.001)
+        received.append(payload)
+        running.remove(payload)
+
+    protocol._subscriptions["topic"] = (callback,)
+    for i in range(20):
+        protocol.handler.handle_message("topic", i)
+    protocol._cb_pool.shutdown(wait=True)
+
+    assert received == list(range(20))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("workers", [0, 1])
+def test_handler_message_preserves_order(monkeypatch, workers):
+    """
+    dispatch_workers가 0(직접 실행) 또는 1일 때 콜백이 수신 순서대로 실행되는지 테스트
+    """
+    monkeypatch.setattr(mqtt_mod, "Client", lambda *a, **k: MagicMock())
+    protocol = MQTTProtocol(BrokerConfig(broker_address="localhost", dispatch_workers=workers), ClientConfig())
+    received = []
+    protocol._subscriptions["topic"] = (lambda t, p: received.append(p),)
+
+    for i in range(50):
+        protocol.handler.handle_message("topic", i)
+    if workers:
+        protocol._cb_pool.shutdown(wait=True)
+    else:
+        assert protocol._cb_pool is None
+
+    assert received == list(range(50))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["non-blocking", "blocking"])
+def test_handler_message_after_disconnect_runs_inline(protocol_factory, mode):
+    """
+    disconnect()로 콜백 풀이 종료된 뒤 도착한 메시지는 버리지 않고 현재 스레드에서 실행되는지 테스트
     """
     protocol, _ = protocol_factory(mode)
-    protocol._subscriptions["test/topic"] = ["not_callable", lambda t, p: None]
+    called = []
+    protocol._subscriptions["test/topic"] = (lambda t, p: called.append(t),)
 
-    # 예외가 발생하지 않아야 함
+    protocol.disconnect()
     protocol.handler.handle_message("test/topic", b"test_data")
 
+    assert protocol._cb_pool is None
+    assert called == ["test/topic"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["non-blocking", "blocking"])
+def test_disconnect_runs_queued_callbacks(protocol_factory, mode):
+    """
+    disconnect() 전에 수신해 대기 중인 콜백이 취소되지 않고 모두 실행되는지 테스트
+    """
+    protocol, _ = protocol_factory(mode)
+    release = threading.Event()
+    received = []
+
+    def callback(topic, payload):
+        release.wait(timeout=1)
+        received.append(payload)
+
+    protocol._subscriptions["test/topic"] = (callback,)
+    pool = protocol._cb_pool
+    for i in range(10):
+        protocol.handler.handle_message("test/topic", i)
+
+    protocol.disconnect()
+    release.set()
+    pool.shutdown(wait=True)
+
+    assert sorted(received) == list(range(10))
+
+
+@pytest.mark.unit
+def test_handler_message_runs_remaining_callbacks_when_pool_closed(protocol_factory):
+    """
+    콜백 풀이 종료되어 submit이 실패해도 나머지 콜백까지 모두 실행되는지 테스트
+    """
+    protocol, _ = protocol_factory()
+    called = []
+    protocol._subscriptions["test/topic"] = (
+        lambda t, p: called.append("first"),
+        lambda t, p: called.append("second"),
+    )
+    protocol._cb_pool.shutdown(wait=True)
+
+    protocol.handler.handle_message("test/topic", b"data")
+
+    assert called == ["first", "second"]
+
+
+@pytest.mark.unit
+def test_start_callback_pool_is_thread_safe(protocol_factory, monkeypatch):
+    """
+    여러 스레드에서 동시에 풀 생성을 요청해도 풀이 하나만 생성되는지 테스트
+    """
+    protocol, _ = protocol_factory()
+    protocol.disconnect()
+    created = []
+    original = mqtt_mod.ThreadPoolExecutor
+
+    def slow_executor(*args, **kwargs):
+        time.sleep(0.01)
+        created.append(original(*args, **kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(mqtt_mod, "ThreadPoolExecutor", slow_executor)
+    threads = [threading.Thread(target=protocol._start_callback_pool) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert protocol._cb_pool is created[0]
+    created[0].shutdown(wait=True)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["non-blocking", "blocking"])
+def test_subscribe_with_non_callable(protocol_factory, mode):
+    """
+    호출 불가능한 콜백은 구독 시점에 거부되는지 테스트
+    """
+    protocol, client = protocol_factory(mode)
+
+    with pytest.raises(ProtocolValidationError, match="호출 불가능한 콜백"):
+        protocol.subscribe("test/topic", "not_callable")
+
+    client.subscribe.assert_not_called()
+    assert "test/topic" not in protocol._subscriptions
+
 
 @pytest.mark.unit
 @pytest.mark.parametrize("mode", ["non-blocking", "blocking"])
@@ -1041,7 +1344,7 @@ def test_handler_flush_publish_queue_with_exception(protocol_factory, mode):
     플러시 중 예외 발생 테스트
     """
     protocol, _ = protocol_factory(mode)
-    protocol._publish_queue.put(("topic", "message", 0, False))
+    protocol._publish_queue.append(("topic", "message", 0, False))
 
     def mock_publish_with_exception(*args):
         raise Exception("Publish failed")
@@ -1172,7 +1475,7 @@ def test_publish_queue_thread_safety(protocol_factory, mode):
         thread.join()
 
     # 큐에 30개의 메시지가 있어야 함 (3 스레드 × 10 메시지)
-    assert protocol._publish_queue.qsize() == 30
+    assert len(protocol._publish_queue) == 30
 
     # 모든 발행이 False를 반환해야 함 (연결되지 않은 상태)
     for _, _, result in messages_sent:
@@ -1240,7 +1543,7 @@ def test_handler_flush_queue_with_mixed_results(protocol_factory, mode):
     ]
 
     for msg in messages:
-        protocol._publish_queue.put(msg)
+        protocol._publish_queue.append(msg)
 
     call_count = 0
     def mock_publish_func(topic, message, qos, retain):
@@ -1259,7 +1562,7 @@ def test_handler_flush_queue_with_mixed_results(protocol_factory, mode):
     protocol.handler.handler_flush_publish_queue(mock_publish_func)
 
     # 모든 메시지가 처리되어야 함
-    assert protocol._publish_queue.empty()
+    assert not protocol._publish_queue
     assert call_count == 3
 
 
@@ -1335,32 +1638,25 @@ def test_reconnect_loop_successful_reconnection_and_exit(protocol_factory, mode,
     """
     protocol, client = protocol_factory(mode)
     protocol._is_connected = False
-    monkeypatch.setattr("time.sleep", lambda *_: None)
+    protocol.broker_config.connect_timeout = 5.0
 
-    # 재연결 성공 시뮬레이션 - 연결 확인 루프에서 성공
+    # 재연결 성공 시뮬레이션 - reconnect 직후 on_connect가 네트워크 스레드에서 도착
     reconnect_call_count = 0
-    connection_check_count = 0
 
     def mock_reconnect():
         nonlocal reconnect_call_count
         reconnect_call_count += 1
-
-    def mock_time_sleep(duration):
-        nonlocal connection_check_count
-        if duration == 0.5:  # 연결 확인 루프의 sleep
-            connection_check_count += 1
-            if connection_check_count == 3:  # 3번째 체크에서 연결 성공
-                protocol._is_connected = True
+        threading.Timer(0.05, setattr, args=(protocol, "_is_connected", True)).start()
 
     client.reconnect.side_effect = mock_reconnect
-    monkeypatch.setattr("time.sleep", mock_time_sleep)
 
     # 재연결 루프 실행
+    started = time.monotonic()
     protocol._reconnect_loop()
 
-    # 재연결이 성공했으므로 루프가 종료되어야 함
+    # 재연결이 성공했으므로 폴링 주기(0.5초)를 기다리지 않고 루프가 종료되어야 함
     assert reconnect_call_count == 1
-    assert connection_check_count == 3
+    assert time.monotonic() - started < 0.5
     if mode == "non-blocking":
         client.loop_start.assert_called_once()
 
@@ -1400,7 +1696,7 @@ def test_on_connect_with_queue_flush_on_reconnect(protocol_factory, mode):
     protocol, client = protocol_factory(mode)
 
     # 큐에 메시지 추가
-    protocol._publish_queue.put(("test/topic", "queued_message", 1, True))
+    protocol._publish_queue.append(("test/topic", "queued_message", 1, True))
     client.publish.return_value.rc = 0
 
     # _on_connect 콜백 호출 (재연결 성공 시뮬레이션)
@@ -1408,7 +1704,7 @@ def test_on_connect_with_queue_flush_on_reconnect(protocol_factory, mode):
 
     # 재연결 성공 후 큐의 메시지가 발행되어야 함
     client.publish.assert_called_with("test/topic", "queued_message", 1, True)
-    assert protocol._publish_queue.empty()
+    assert not protocol._publish_queue
     assert protocol._is_connected is True
 
 
@@ -1452,38 +1748,30 @@ def test_reconnect_loop_exponential_backoff_with_max_delay_reached(protocol_fact
 @pytest.mark.parametrize("mode", ["non-blocking", "blocking"])
 def test_reconnect_loop_connection_check_with_partial_success(protocol_factory, mode, monkeypatch):
     """
-    재연결 후 연결 확인 중 일부 성공 테스트
+    재연결 후 연결 확인 대기 중 연결이 성립되는 테스트
     """
     protocol, client = protocol_factory(mode)
     protocol._is_connected = False
-    monkeypatch.setattr("time.sleep", lambda *_: None)
 
-    # 재연결은 성공하지만 연결 확인에서 지연
+    # 첫 번째 시도는 연결 확인 시간 초과, 두 번째 시도에서 연결 성공
     reconnect_call_count = 0
-    connection_check_count = 0
 
     def mock_reconnect():
         nonlocal reconnect_call_count
         reconnect_call_count += 1
-
-    def mock_time_sleep(duration):
-        nonlocal connection_check_count
-        if duration == 0.5:  # 연결 확인 루프의 sleep
-            connection_check_count += 1
-            if connection_check_count == 5:  # 5번째 체크에서 연결 성공
-                protocol._is_connected = True
+        if reconnect_call_count == 2:
+            protocol._is_connected = True
 
     client.reconnect.side_effect = mock_reconnect
-    monkeypatch.setattr("time.sleep", mock_time_sleep)
+    protocol._stop_reconnect.wait = lambda delay: False
 
     # 재연결 루프 실행
     protocol._reconnect_loop()
 
     # 재연결이 성공했으므로 루프가 종료되어야 함
-    assert reconnect_call_count == 1
-    assert connection_check_count == 5
+    assert reconnect_call_count == 2
     if mode == "non-blocking":
-        client.loop_start.assert_called_once()
+        assert client.loop_start.call_count == 2
 
 
 @pytest.mark.unit
@@ -1570,7 +1858,7 @@ def test_handler_flush_queue_with_publish_failure_and_success_mix(protocol_facto
     ]
 
     for msg in messages:
-        protocol._publish_queue.put(msg)
+        protocol._publish_queue.append(msg)
 
     publish_calls = []
     def mock_publish_func(topic, message, qos, retain):
@@ -1588,7 +1876,7 @@ def test_handler_flush_queue_with_publish_failure_and_success_mix(protocol_facto
 
     # 모든 메시지가 처리되어야 함
     assert len(publish_calls) == 4
-    assert protocol._publish_queue.empty()
+    assert not protocol._publish_queue
 
     # 호출된 메시지들 확인
     expected_calls = [
@@ -0,0 +1,212 @@
+import collections
+import threading
+import time
+
+import pytest
+
+from app.data import SendData
+from app.interfaces.protocol import ReqResProtocol
+
+
+class FakeProtocol(ReqResProtocol):
+    """연결 실패 횟수와 연결 끊김을 지정할 수 있는 프로토콜"""
+
+    def __init__(self, connect_failures=0):
+        self.connect_failures = connect_failures
+        self.connect_calls = 0
+        self.broken = False
+        self.sent = []
+
+    def connect(self):
+        self.connect_calls += 1
+        return self.connect_calls > self.connect_failures
+
+    def disconnect(self):
+        pass
+
+    def send(self, data):
+        self.sent.append(bytes(data))
+        return not self.broken
+
+    def read(self):
+        if self.broken:
+            time.sleep(0.001)
+            return False, None
+        return True, None
+
+
+@pytest.fixture
+def handler_factory(monkeypatch, legacy_modules):
+    """
+    create_protocol을 FakeProtocol 생성으로 대체한 NetworkHandler를 만들고, 테스트 종료 시 정리하는 fixture
+    """
+    network_mod = legacy_modules.network
+    created = []
+
+    def factory(connect_failures=0, **kwargs):
+        protocols = []
+
+        def create_protocol(params):
+            protocol = FakeProtocol(connect_failures)
+            protocols.append(protocol)
+            return protocol
+
+        monkeypatch.setattr(network_mod, "create_protocol", create_protocol)
+        handler = network_mod.NetworkHandler({}, network_mod.NetworkEvent(), net_id="test", retry_interval=0.001, **kwargs)
+        created.append(handler)
+        return handler, protocols
+
+    yield factory
+
+    for handler in created:
+        handler.stop()
+        if handler.is_alive():
+            handler.join(timeout=2)
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.001)
+    return predicate()
+
+
+@pytest.mark.unit
+def test_connect_retries_until_success(handler_factory):
+    """
+    연결에 실패하면 retry_interval 간격으로 재시도하여 연결되는지 테스트
+    """
+    handler, protocols = handler_factory(connect_failures=3)
+    handler.start()
+
+    assert wait_until(handler.is_connected)
+    assert len(protocols) == 1
+    assert protocols[0].connect_calls == 4
+
+
+@pytest.mark.unit
+def test_single_disconnect_reconnects_once(handler_factory):
+    """
+    연결 끊김 한 번에 재연결이 정확히 한 번만 일어나는지 테스트
+    (이전 Listener가 종료 전까지 반복 호출하는 on_disconnected로 재연결이 반복되지 않아야 함)
+    """
+    handler, protocols = handler_factory()
+    handler.start()
+    assert wait_until(lambda: handler.is_connected() and len(protocols) == 1)
+
+    protocols[0].broken = True
+    assert wait_until(lambda: len(protocols) == 2 and handler.is_connected())
+
+    time.sleep(0.2)
+    assert len(protocols) == 2
+    assert handler.is_connected()
+
+
+@pytest.mark.unit
+def test_stop_while_connecting(handler_factory):
+    """
+    연결 재시도 중 stop() 호출 시 스레드가 종료되는지 테스트
+    """
+    handler, protocols = handler_factory(connect_failures=10 ** 9)
+    handler.start()
+    assert wait_until(lambda: protocols and protocols[0].connect_calls > 1)
+
+    handler.stop()
+    handler.join(timeout=2)
+    assert not handler.is_alive()
+    assert not handler.is_connected()
+
+
+@pytest.mark.unit
+def test_send_data_before_connect(handler_factory):
+    """
+    연결 전에는 요청 큐가 없으므로 send_data가 False를 반환하는지 테스트
+    """
+    handler, _ = handler_factory()
+    assert handler.send_data(SendData(b"CMD")) is False
+
+
+@pytest.mark.unit
+def test_send_data_rejects_invalid_type(handler_factory):
+    """
+    SendData가 아닌 데이터는 ValueError가 발생하는지 테스트
+    """
+    handler, _ = handler_factory()
+    with pytest.raises(ValueError):
+        handler.send_data(b"CMD")
+
+
+@pytest.mark.unit
+def test_send_data_is_sent_after_connect(handler_factory):
+    """
+    연결 후 send_data로 추가한 요청이 프로토콜로 송신되는지 테스트
+    """
+    handler, protocols = handler_factory()
+    handler.start()
+    assert wait_until(handler.is_connected)
+
+    assert handler.send_data(SendData(b"CMD", (b"1",))) is True
+    assert wait_until(lambda: protocols[0].sent == [b"$CMD#1$"])
+
+
+def attach_queue(handler):
+    """연결 없이 send_data를 확인할 수 있도록 빈 요청 큐를 연결"""
+    handler._request_queue = collections.deque()
+    return handler._request_queue
+
+
+@pytest.mark.unit
+def test_send_data_rejects_when_queue_full(handler_factory):
+    """
+    큐가 가득 차면 가장 오래된 요청을 버리지 않고 새 요청을 거부하는지 테스트
+    """
+    handler, _ = handler_factory(max_queue_size=2)
+    queue = attach_queue(handler)
+    items = [SendData(b"C", (str(i),)) for i in range(3)]
+
+    assert [handler.send_data(item) for item in items] == [True, True, False]
+    assert list(queue) == items[:2]
+
+
+@pytest.mark.unit
+def test_send_data_concurrent_producers_respect_limit(handler_factory):
+    """
+    여러 스레드가 동시에 send_data를 호출해도 큐 크기 제한을 넘지 않고, 수락된 요청만 큐에 남는지 테스트
+    """
+    handler, _ = handler_factory(max_queue_size=100)
+    queue = attach_queue(handler)
+    accepted = []
+
+    def produce(worker):
+        for i in range(50):
+            item = SendData(b"C", (str(worker), str(i)))
+            if handler.send_data(item):
+                accepted.append(item)
+
+    threads = [threading.Thread(target=produce, args=(w,)) for w in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(queue) == 100
+    assert sorted(queue, key=repr) == sorted(accepted, key=repr)
+
+
+@pytest.mark.unit
+def test_send_data_uses_current_queue(handler_factory):
+    """
+    재연결로 요청 큐가 교체되면 이후 요청은 새 큐에 추가되고 크기 제한도 새 큐 기준으로 확인하는지 테스트
+    """
+    handler, _ = handler_factory(max_queue_size=1)
+    old_queue = attach_queue(handler)
+    assert handler.send_data(SendData(b"A")) is True
+
+    new_queue = attach_queue(handler)
+    assert handler.send_data(SendData(b"B")) is True
+    assert handler.send_data(SendData(b"C")) is False
+
+    assert list(old_queue) == [SendData(b"A")]
+    assert list(new_queue) == [SendData(b"B")]
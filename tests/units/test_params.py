@@ -162,3 +162,66 @@ def test_cast_data_type_edge_cases(sample_config):
     # 대소문자 혼합 bool
     assert p.cast_data_type("true") is True
     assert p.cast_data_type("false") is False
+
+
+@pytest.mark.unit
+def test_cast_result_is_cached(sample_config, mocker):
+    """같은 키를 반복 접근해도 cast_data_type은 한 번만 호출되는지 확인"""
+    p = Params(sample_config)
+    spy = mocker.spy(Params, "cast_data_type")
+    assert p["int_value"] == 10
+    assert p.int_value == 10
+    assert p["INT_VALUE"] == 10
+    assert spy.call_count == 1
+
+
+@pytest.mark.unit
+def test_cast_data_type_non_numeric_and_non_str(sample_config):
+    """숫자로 시작하지 않는 문자열과 문자열이 아닌 값은 그대로 반환되는지 확인"""
+    p = Params(sample_config)
+    assert p.cast_data_type("mqtt") == "mqtt"
+    assert p.cast_data_type("12abc") == "12abc"
+    assert p.cast_data_type("1e3") == approx(1000.0)
+    assert p.cast_data_type(3.5) == approx(3.5)
+    assert p.cast_data_type(None) is None
+
+
+@pytest.mark.unit
+def test_mixed_case_configure_keys():
+    """설정 딕셔너리의 키가 대문자를 포함해도 대소문자 구분 없이 조회되는지 확인"""
+    p = Params({"Broker_Address": "localhost", "PORT": "1883"})
+    assert p.include("broker_address") is True
+    assert p["broker_address"] == "localhost"
+    assert p.port == 1883
+
+
+@pytest.mark.unit
+def test_getattr_underscore_names_raise(sample_config):
+    """밑줄로 시작하는 속성 탐색은 설정 조회 대신 AttributeError를 발생시키는지 확인"""
+    import copy
+
+    p = Params(sample_config)
+    assert not hasattr(p, "__wrapped__")
+    assert not hasattr(p, "_ipython_canary_method_should_not_exist_")
+    assert p["int_value"] == 10
+
+    cloned = copy.deepcopy(p)
+    assert cloned.int_value == 10
+
+
+@pytest.mark.unit
+def test_list_value_copy_not_shared(sample_config):
+    """리스트 값을 수정해도 캐시된 설정값이 바뀌지 않는지 확인"""
+    p = Params(sample_config)
+    first = p.list_value
+    first.append(4)
+    assert p.list_value == [1, 2, 3]
+    assert p["list_value"] is not p["list_value"]
+
+
+@pytest.mark.unit
+def test_non_str_keys():
+    """문자열이 아닌 키가 있어도 생성 시 예외 없이 문자열 키로 조회되는지 확인"""
+    p = Params({1: "10", "Name": "eq1"})
+    assert p["1"] == 10
+    assert p.name == "eq1"
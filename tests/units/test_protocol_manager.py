@@ -26,6 +26,18 @@ def test_reqres_load_and_get(mock_reqres_plugin):
     assert ReqResManager.get("tcp") is mock_reqres_plugin
 
 
+@pytest.mark.unit
+def test_reqres_get_case_insensitive(mock_reqres_plugin):
+    """
+    대소문자가 섞인 이름으로 등록/조회해도 같은 플러그인이 반환되는지 테스트합니다.
+    """
+    ReqResManager._plugins.clear()
+    ReqResManager.load("TCP", mock_reqres_plugin)
+    assert list(ReqResManager._plugins) == ["tcp"]
+    assert ReqResManager.get("tcp") is mock_reqres_plugin
+    assert ReqResManager.get("Tcp") is mock_reqres_plugin
+
+
 @pytest.mark.unit
 def test_reqres_get_missing():
     """
@@ -0,0 +1,233 @@
+import collections
+import threading
+import time
+
+import pytest
+
+from app.data import PacketStructure, SendData
+from app.interfaces.protocol import ReqResProtocol
+
+
+class FakeProtocol(ReqResProtocol):
+    """send 호출을 기록하고 지정한 결과를 반환하는 프로토콜"""
+
+    def __init__(self, result=True):
+        self.result = result
+        self.sent = []
+
+    def connect(self):
+        return True
+
+    def disconnect(self):
+        pass
+
+    def send(self, data):
+        self.sent.append(bytes(data))
+        return self.result
+
+    def read(self):
+        return True, None
+
+
+class RecordingEvent:
+    """Requester 이벤트 호출을 기록 (fixture에서 RequesterEvent로 등록)"""
+
+    def __init__(self):
+        self.sent = []
+        self.failed = []
+        self.disconnected = []
+
+    def on_sent(self, data):
+        self.sent.append(data)
+
+    def on_failed_send(self, data):
+        self.failed.append(data)
+
+    def on_disconnected(self, data):
+        self.disconnected.append(data)
+
+
+@pytest.fixture
+def requester_factory(legacy_modules):
+    """
+    FakeProtocol/RecordingEvent로 Requester를 생성하고, 테스트 종료 시 스레드를 정리하는 fixture
+    """
+    Requester = legacy_modules.requester.Requester
+    legacy_modules.requester.RequesterEvent.register(RecordingEvent)
+    created = []
+
+    def factory(result=True, **kwargs):
+        protocol = FakeProtocol(result)
+        event = RecordingEvent()
+        queue = collections.deque()
+        queue_event = threading.Event()
+        requester = Requester(
+            event_callback=event,
+            protocol=protocol,
+            request_queue=queue,
+            queue_event=queue_event,
+            **kwargs
+        )
+        created.append(requester)
+        return requester, protocol, event, queue, queue_event
+
+    yield factory
+
+    for requester in created:
+        requester.stop()
+        if requester.is_alive():
+            requester.join(timeout=1)
+
+
+def wait_until(predicate, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.001)
+    return predicate()
+
+
+@pytest.mark.unit
+def test_next_batch_times_out_when_empty(requester_factory):
+    """
+    큐가 비어 있으면 queue_wait_time 후 빈 배치를 반환하는지 테스트
+    """
+    requester, *_ = requester_factory(queue_wait_time=0.01)
+    assert requester.next_batch() == []
+
+
+@pytest.mark.unit
+def test_next_batch_wakes_on_queue_event(requester_factory):
+    """
+    대기 중 요청이 추가되고 이벤트가 설정되면 queue_wait_time을 기다리지 않고 깨어나는지 테스트
+    """
+    requester, _, _, queue, queue_event = requester_factory(queue_wait_time=5)
+    data = SendData(b"CMD")
+
+    def produce():
+        queue.append(data)
+        queue_event.set()
+
+    threading.Timer(0.05, produce).start()
+    started = time.monotonic()
+    assert requester.next_batch() == [data]
+    assert time.monotonic() - started < 1
+
+
+@pytest.mark.unit
+def test_next_batch_respects_batch_size(requester_factory):
+    """
+    한 번에 batch_size개까지만 꺼내고 나머지는 큐에 남기는지 테스트
+    """
+    requester, _, _, queue, _ = requester_factory(batch_size=2)
+    items = [SendData(b"C", (str(i),)) for i in range(3)]
+    queue.extend(items)
+
+    assert requester.next_batch() == items[:2]
+    assert list(queue) == items[2:]
+
+
+@pytest.mark.unit
+def test_stop_wakes_idle_requester(requester_factory):
+    """
+    요청이 없어 대기 중인 Requester가 stop() 호출 시 즉시 종료되는지 테스트
+    """
+    requester, *_ = requester_factory(queue_wait_time=5)
+    requester.start()
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    requester.stop()
+    requester.join(timeout=1)
+    assert not requester.is_alive()
+    assert time.monotonic() - started < 1
+
+
+@pytest.mark.unit
+def test_run_sends_queued_requests_in_one_send(requester_factory):
+    """
+    큐에 쌓인 요청을 하나의 버퍼로 한 번에 송신하고, 요청마다 on_sent를 호출하는지 테스트
+    """
+    requester, protocol, event, queue, queue_event = requester_factory()
+    items = [SendData(b"A", (b"1",)), SendData(b"B")]
+    queue.extend(items)
+    queue_event.set()
+
+    requester.start()
+    assert wait_until(lambda: len(event.sent) == 2)
+
+    assert protocol.sent == [
+        PacketStructure.to_packets_from_parts(item.to_parts() for item in items)
+    ]
+    assert event.sent == items
+    assert event.failed == [] and event.disconnected == []
+
+
+class BrokenSendData(SendData):
+    """프레임 변환 시 예외가 발생하는 요청"""
+
+    def to_parts(self):
+        raise TypeError("broken")
+
+
+@pytest.mark.unit
+def test_run_reports_items_that_fail_to_build(requester_factory):
+    """
+    프레임 변환에 실패한 요청만 on_failed_send로 알리고, 나머지 요청은 송신되는지 테스트
+    """
+    requester, protocol, event, queue, queue_event = requester_factory()
+    good = SendData(b"A")
+    broken = BrokenSendData(b"B")
+    queue.extend([good, broken])
+    queue_event.set()
+
+    requester.start()
+    assert wait_until(lambda: event.sent and event.failed)
+
+    assert protocol.sent == [b"$A$"]
+    assert event.sent == [good]
+    assert event.failed == [broken]
+    assert event.disconnected == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("raises", [False, True])
+def test_run_failed_send_reports_disconnect_once(requester_factory, monkeypatch, raises):
+    """
+    송신 실패(False 반환 또는 예외) 시 요청마다 on_failed_send, 배치당 한 번 on_disconnected를 호출하는지 테스트
+    """
+    requester, protocol, event, queue, queue_event = requester_factory(result=False)
+    if raises:
+        def send(data):
+            raise OSError("closed")
+        monkeypatch.setattr(protocol, "send", send)
+    items = [SendData(b"C", (str(i),)) for i in range(3)]
+    queue.extend(items)
+    queue_event.set()
+
+    requester.start()
+    assert wait_until(lambda: len(event.failed) == 3)
+    time.sleep(0.05)
+
+    assert event.failed == items
+    assert event.disconnected == [items[0]]
+    assert event.sent == []
+
+
+@pytest.mark.unit
+def test_requester_without_queue_event(requester_factory, legacy_modules):
+    """
+    queue_event 없이 기존 위치 인자로 생성해도 queue_wait_time 간격으로 요청을 송신하는지 테스트
+    """
+    protocol = FakeProtocol()
+    event = RecordingEvent()
+    queue = collections.deque([SendData(b"A")])
+    requester = legacy_modules.requester.Requester(event, protocol, queue, "./public/network.ini", 0.01)
+    requester.start()
+    try:
+        assert wait_until(lambda: event.sent)
+        assert protocol.sent == [b"$A$"]
+    finally:
+        requester.stop()
+        requester.join(timeout=1)
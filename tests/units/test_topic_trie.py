@@ -0,0 +1,102 @@
+import pytest
+from app.protocols.mqtt.topic_trie import TopicTrie, is_wildcard_filter
+
+
+def cb_a(topic, payload):
+    pass
+
+
+def cb_b(topic, payload):
+    pass
+
+
+@pytest.mark.unit
+def test_is_wildcard_filter():
+    """
+    와일드카드 필터 판별 테스트
+    """
+    assert is_wildcard_filter("sensors/+/temp")
+    assert is_wildcard_filter("sensors/#")
+    assert not is_wildcard_filter("sensors/1/temp")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("topic_filter, topic, expected", [
+    ("a/b/c", "a/b/c", True),
+    ("a/b/c", "a/b", False),
+    ("a/+/c", "a/b/c", True),
+    ("a/+/c", "a/b/d", False),
+    ("a/+", "a/b/c", False),
+    ("+/+", "a/b", True),
+    ("a/#", "a", True),
+    ("a/#", "a/b/c", True),
+    ("a/#", "b/c", False),
+    ("#", "a/b/c", True),
+    ("+/b/#", "x/b", True),
+    ("a/+/", "a/b/", True),
+])
+def test_match(topic_filter, topic, expected):
+    """
+    MQTT 규격의 '+', '#' 매칭 테스트
+    """
+    trie = TopicTrie()
+    trie.set(topic_filter, (cb_a,))
+    assert (trie.match(topic) == (cb_a,)) is expected
+
+
+@pytest.mark.unit
+def test_system_topic_not_matched_by_leading_wildcard():
+    """
+    '$'로 시작하는 토픽은 첫 레벨 와일드카드와 일치하지 않는지 테스트
+    """
+    trie = TopicTrie()
+    trie.set("#", (cb_a,))
+    trie.set("+/broker/uptime", (cb_a,))
+    trie.set("$SYS/#", (cb_b,))
+    assert trie.match("$SYS/broker/uptime") == (cb_b,)
+
+
+@pytest.mark.unit
+def test_match_collects_all_filters():
+    """
+    여러 필터에 일치하면 필터별 콜백이 모두 반환되는지 테스트
+    """
+    trie = TopicTrie()
+    trie.set("a/+", (cb_a,))
+    trie.set("a/#", (cb_b,))
+    trie.set("a/b", (cb_a, cb_b))
+    assert sorted(trie.match("a/b"), key=id) == sorted((cb_a, cb_b, cb_a, cb_b), key=id)
+
+
+@pytest.mark.unit
+def test_set_empty_removes_filter_and_prunes_nodes():
+    """
+    빈 튜플로 set 하면 필터가 제거되고 빈 노드가 정리되는지 테스트
+    """
+    trie = TopicTrie()
+    trie.set("a/+/c", (cb_a,))
+    trie.set("a/#", (cb_b,))
+    assert len(trie) == 2
+
+    trie.set("a/+/c", ())
+    assert len(trie) == 1
+    assert trie.match("a/b/c") == (cb_b,)
+    assert "+" not in trie._root.children["a"].children
+
+    trie.set("a/#", ())
+    assert len(trie) == 0
+    assert not trie
+    assert trie._root.children == {}
+
+
+@pytest.mark.unit
+def test_remove_unknown_filter_is_noop():
+    """
+    등록되지 않은 필터 제거 시 아무 변화가 없는지 테스트
+    """
+    trie = TopicTrie()
+    trie.set("a/b", (cb_a,))
+    trie.set("a/b/c", ())
+    trie.set("a", ())
+    assert len(trie) == 1
+    assert trie.match("a/b") == (cb_a,)